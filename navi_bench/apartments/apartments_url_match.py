@@ -1,6 +1,7 @@
 import json
 import re
-from urllib.parse import urlencode
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode
 
 from beartype import beartype
 from loguru import logger
@@ -12,7 +13,6 @@ from navi_bench.base import (
     UrlMetricInput,
     basic_normalize_url,
     build_task_config,
-    parse_filtered_query_params,
     repr_with_attr,
 )
 from navi_bench.dates import initialize_user_metadata
@@ -48,15 +48,30 @@ _APARTMENT_FEATURES = frozenset(
     }
 )
 
-# `_APARTMENT_FEATURES` ordered longest-first so `_normalize_apartment_features` extracts
-# multi-word features (e.g. "air-conditioning") before any shorter feature that could be a
-# substring of a longer one.
-_APARTMENT_FEATURES_BY_LENGTH_DESC = sorted(_APARTMENT_FEATURES, key=len, reverse=True)
+# `_APARTMENT_FEATURES` ordered longest-first, each with its compiled pattern, so
+# `_normalize_apartment_features` extracts multi-word features (e.g. "air-conditioning") before
+# any shorter feature that could be a substring of a longer one.
+_APARTMENT_FEATURE_PATTERNS_BY_LENGTH_DESC = tuple(
+    (feature, re.compile(re.escape(feature))) for feature in sorted(_APARTMENT_FEATURES, key=len, reverse=True)
+)
+
+# Alternation over `_APARTMENT_FEATURES`, only used to tell in one scan whether a path segment
+# contains any feature at all. Extraction must stay per-feature: a single leftmost-first
+# alternation picks different features than the longest-first sweep
+# (e.g. "dishwasher" rather than "washer-dryer" in "dishwasher-dryer").
+_APARTMENT_FEATURES_PATTERN = re.compile(
+    "|".join(re.escape(feature) for feature, _ in _APARTMENT_FEATURE_PATTERNS_BY_LENGTH_DESC)
+)
+
+# Separator between locations in the "n=" query parameter. parse_qsl converts "+" to spaces,
+# so split on both '+' and whitespace.
+_LOCATION_SPLIT_PATTERN = re.compile(r"[+\s]+")
 
 
 @beartype
 class ApartmentsUrlMatch(ResetsViaState):
-    IGNORED_PARAMS = ("io", "ss")
+    # Query parameters dropped before URL comparison, including bb=.
+    IGNORED_PARAMS = frozenset({"io", "ss", "bb"})
 
     def __init__(self, gt_url: str | list[str]) -> None:
         super().__init__()
@@ -65,6 +80,14 @@ class ApartmentsUrlMatch(ResetsViaState):
             self.gt_urls = [gt_url]
         else:
             self.gt_urls = gt_url
+        # GT URLs are fixed for the lifetime of the metric, so normalize them once up front
+        # rather than on every `update` call. Maps each normalized GT URL to the first raw GT
+        # URL producing it, turning the per-update check into a single hash lookup.
+        self._normalized_gt_urls: dict[str, str] = {}
+        for gt in self.gt_urls:
+            self._normalized_gt_urls.setdefault(self._normalize_url(gt), gt)
+        # Agents often land on a GT URL verbatim; checking the raw form first skips normalization.
+        self._raw_gt_urls = frozenset(self.gt_urls)
         self._reset_state()
 
     def _reset_state(self) -> None:
@@ -77,18 +100,23 @@ class ApartmentsUrlMatch(ResetsViaState):
         inputs: UrlMetricInput = kwargs
         url = inputs["url"]
 
-        # Normalize the state URL
-        normalized_url = self._normalize_url(url or "")
+        # The match is sticky until reset, so later URLs cannot change the result
+        if self._found_match:
+            return
 
-        # Check against all ground truth URLs
-        for gt_url in self.gt_urls:
-            normalized_gt_url = self._normalize_url(gt_url)
-            if normalized_url == normalized_gt_url:
-                self._found_match = True
-                logger.info(f"ApartmentsUrlMatch.update found match: {url} matches GT URL: {gt_url}")
-                return  # Early exit once match is found
+        if url in self._raw_gt_urls:
+            gt_url = url
+        else:
+            # Normalize the state URL and check against all ground truth URLs
+            gt_url = self._normalized_gt_urls.get(self._normalize_url(url or ""))
+        if gt_url is not None:
+            self._found_match = True
+            logger.info(f"ApartmentsUrlMatch.update found match: {url} matches GT URL: {gt_url}")
+            return
 
-        logger.info(f"ApartmentsUrlMatch.update did not find match: {url}")
+        # Non-matches are the common case on every step; log at debug with deferred formatting so
+        # the message is only built when a sink actually wants it.
+        logger.debug("ApartmentsUrlMatch.update did not find match: {}", url)
 
     async def compute(self) -> FinalResult:
         score = 1.0 if self._found_match else 0.0
@@ -102,15 +130,15 @@ class ApartmentsUrlMatch(ResetsViaState):
         if not part or "-" not in part:
             return False
 
-        return (
-            any(part.endswith(f"-{state}") for state in _STATE_ABBREVIATIONS) or len(part.split("-")[-1]) == 2
-        )  # area_city_state format
+        # area_city_state format: the trailing "-" piece is a state abbreviation
+        tail = part.rpartition("-")[2]
+        return tail in _STATE_ABBREVIATIONS or len(tail) == 2
 
     @staticmethod
     def _normalize_apartment_features(part: str) -> str:
         """Normalize apartment features by sorting them alphabetically."""
         # Check if this part contains any apartment features
-        if not any(feature in part for feature in _APARTMENT_FEATURES):
+        if not _APARTMENT_FEATURES_PATTERN.search(part):
             return part
 
         # Extract features and non-features
@@ -118,10 +146,10 @@ class ApartmentsUrlMatch(ResetsViaState):
         remaining = part
 
         # Extract known features (longest first to avoid partial matches)
-        for feature in _APARTMENT_FEATURES_BY_LENGTH_DESC:
-            if feature in remaining:
+        for feature, pattern in _APARTMENT_FEATURE_PATTERNS_BY_LENGTH_DESC:
+            if pattern.search(remaining):
                 found_features.append(feature)
-                remaining = remaining.replace(feature, "-").replace("--", "-").strip("-")
+                remaining = pattern.sub("-", remaining).replace("--", "-").strip("-")
 
         # Get non-feature parts
         non_features = [p for p in remaining.split("-") if p]
@@ -132,16 +160,20 @@ class ApartmentsUrlMatch(ResetsViaState):
         return "-".join(p for p in all_parts if p)
 
     @staticmethod
-    def _extract_locations_from_path(path_parts: list[str]) -> tuple[set[str], list[str]]:
-        """Extract locations from URL path parts and return (locations, non_location_parts)."""
-        locations = set()
+    def _extract_locations_from_path(path_parts: list[str]) -> tuple[list[str], list[str]]:
+        """Extract locations from URL path parts and return (locations, non_location_parts).
+
+        Locations are returned as a (possibly duplicated) list; callers dedupe when merging them
+        with the query-string locations.
+        """
+        locations = []
         non_location_parts = []
 
         for part in path_parts:
             if ApartmentsUrlMatch._is_location_part(part):
                 # Replace underscores with hyphens for consistency
                 location = part.replace("_", "-")
-                locations.add(location)
+                locations.append(location)
             else:
                 # Normalize apartment features if present
                 normalized_part = ApartmentsUrlMatch._normalize_apartment_features(part)
@@ -150,70 +182,85 @@ class ApartmentsUrlMatch(ResetsViaState):
         return locations, non_location_parts
 
     @staticmethod
-    def _extract_locations_from_query(query_params: dict) -> tuple[set[str], dict]:
-        """Extract locations from query parameters and return (locations, normalized_params)."""
+    def _extract_locations_from_query(query: str, ignored_params: frozenset[str]) -> tuple[set[str], dict]:
+        """Extract locations from a query string and return (locations, normalized_params).
+
+        Parses, filters `ignored_params`, and splits out the "n" locations in a single pass over
+        `parse_qsl` pairs, skipping ignored keys before any value list is built for them.
+        """
         locations = set()
-        normalized_params = {}
+        normalized_params: dict[str, list[str]] = {}
+        seen_n = False
 
-        for key, values in query_params.items():
-            if key == "n" and values:
-                # Parse locations. parse_qs converts "+" to spaces, so split on '+' and whitespace.
-                raw_value = values[0]
-                location_parts = [p for p in re.split(r"[+\s]+", raw_value.strip()) if p]
+        for key, value in parse_qsl(query):
+            if key in ignored_params:
+                continue
+            if key == "n":
+                # Parse locations, only from the first "n" parameter
+                if seen_n:
+                    continue
+                seen_n = True
+                location_parts = [p for p in _LOCATION_SPLIT_PATTERN.split(value.strip()) if p]
                 for loc in location_parts:
                     # Replace underscores with hyphens for consistency
                     normalized_loc = loc.replace("_", "-")
                     locations.add(normalized_loc)
-            elif key == "bb":
-                # Ignore bb= parameter for URL comparisons
-                continue
             else:
                 # Keep other parameters as is
-                normalized_params[key] = values
+                normalized_params.setdefault(key, []).append(value)
 
         return locations, normalized_params
 
     def _normalize_url(self, url: str) -> str:
         """Normalize URL by treating locations as sets so order doesn't matter."""
-        parsed, fallback = basic_normalize_url(url, "apartments.com")
-        if parsed is None:
-            return fallback
+        return _normalize_apartments_url(url, self.IGNORED_PARAMS)
 
-        # Extract locations from both path and query parameters
-        path_parts = [part for part in parsed.path.split("/") if part]
-        path_locations, non_location_path_parts = self._extract_locations_from_path(path_parts)
 
-        query_params = parse_filtered_query_params(parsed.query, self.IGNORED_PARAMS)
-        query_locations, normalized_params = self._extract_locations_from_query(query_params)
+@lru_cache(maxsize=4096)
+def _normalize_apartments_url(url: str, ignored_params: frozenset[str]) -> str:
+    """Cached implementation of `ApartmentsUrlMatch._normalize_url`.
 
-        # Combine all locations and sort for canonical representation
-        all_locations = path_locations | query_locations
-        sorted_locations = sorted(all_locations)
+    Agents tend to revisit the same URLs across steps, so memoizing on the raw URL skips
+    re-parsing them. `ignored_params` is part of the key (as a hashable frozenset) so subclasses
+    overriding `IGNORED_PARAMS` do not share entries.
+    """
+    parsed, fallback = basic_normalize_url(url, "apartments.com")
+    if parsed is None:
+        return fallback
 
-        if sorted_locations:
-            # First location goes in path, rest in query parameter 'n'
-            primary_location = sorted_locations[0]
-            remaining_locations = sorted_locations[1:]
+    # Extract locations from both path and query parameters
+    path_parts = [part for part in parsed.path.split("/") if part]
+    path_locations, non_location_path_parts = ApartmentsUrlMatch._extract_locations_from_path(path_parts)
 
-            # Construct normalized path
-            normalized_path_parts = [primary_location] + non_location_path_parts
+    query_locations, normalized_params = ApartmentsUrlMatch._extract_locations_from_query(parsed.query, ignored_params)
 
-            # Add remaining locations to query parameter 'n' if there are any
-            if remaining_locations:
-                normalized_params["n"] = ["+".join(remaining_locations)]
-        else:
-            normalized_path_parts = non_location_path_parts
+    # Combine all locations and sort for canonical representation
+    sorted_locations = sorted(query_locations.union(path_locations))
 
-        # Reconstruct URL
-        normalized_path = "/" + "/".join(normalized_path_parts) if normalized_path_parts else ""
-        # Canonicalize query parameter ordering by sorting keys for stable comparisons
-        normalized_query = urlencode(sorted(normalized_params.items()), doseq=True) if normalized_params else ""
+    if sorted_locations:
+        # First location goes in path, rest in query parameter 'n'
+        primary_location = sorted_locations[0]
+        remaining_locations = sorted_locations[1:]
 
-        result = parsed.netloc + normalized_path
-        if normalized_query:
-            result += "?" + normalized_query
+        # Construct normalized path
+        normalized_path_parts = [primary_location] + non_location_path_parts
 
-        return result
+        # Add remaining locations to query parameter 'n' if there are any
+        if remaining_locations:
+            normalized_params["n"] = ["+".join(remaining_locations)]
+    else:
+        normalized_path_parts = non_location_path_parts
+
+    # Reconstruct URL
+    normalized_path = "/" + "/".join(normalized_path_parts) if normalized_path_parts else ""
+    # Canonicalize query parameter ordering by sorting keys for stable comparisons
+    normalized_query = urlencode(sorted(normalized_params.items()), doseq=True) if normalized_params else ""
+
+    result = parsed.netloc + normalized_path
+    if normalized_query:
+        result += "?" + normalized_query
+
+    return result
 
 
 def generate_task_config(
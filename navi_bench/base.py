@@ -3,7 +3,7 @@ import json
 import types
 from collections.abc import Callable, Iterable
 from datetime import datetime, timezone
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 from typing import Any, TypedDict, TypeVar, Union, get_args, get_origin
 from urllib.parse import ParseResult, parse_qs, urlparse
@@ -14,16 +14,26 @@ from playwright.async_api import Error as PlaywrightError
 from pydantic import BaseModel, Field
 
 
+@lru_cache(maxsize=1024)
 def get_import_path(obj: Any) -> str:
-    """Get the import path of an object."""
+    """Get the import path of an object.
+
+    Memoized on ``obj``, which must therefore be hashable (in practice a class or function).
+    """
     return f"{obj.__module__}.{obj.__qualname__}"
 
 
+@cache
 def read_sidecar(module_file: str, filename: str) -> str:
-    """Read a sidecar file located next to ``module_file`` (typically ``__file__``)."""
+    """Read a sidecar file located next to ``module_file`` (typically ``__file__``).
+
+    Memoized per process: sidecars ship with the package and are read once, not once per
+    verifier instance (the ``cached_property`` wrappers around call sites are per instance).
+    """
     return (Path(module_file).parent / filename).read_text()
 
 
+@cache
 def read_sidecar_with_shared_js_prefix(
     module_file: str, filename: str, *, shared_filename: str = "../dom_visibility.js"
 ) -> str:
@@ -97,11 +107,13 @@ def strip_url_scheme(url: str) -> str:
 def basic_normalize_url(url: str, target_domain: str) -> tuple[ParseResult | None, str]:
     """Apply the opening of URL normalization shared across navi-bench domain matchers.
 
-    Lowercases, strips http(s)://www., and runs ``urlparse`` on the result. When the URL's
-    netloc matches ``target_domain``, returns ``(parsed, "")`` so the caller can proceed with
-    its domain-specific normalization. Otherwise returns ``(None, fallback)`` where fallback
-    is a basic-normalized "netloc + path[?query]" string with any trailing slash stripped —
-    this is the form domain matchers return as-is for off-domain URLs.
+    Lowercases, strips http(s)://www. via ``strip_url_scheme``, and runs ``urlparse`` on the
+    result. ``urlparse`` (unlike ``urlsplit``) moves any ``;params`` of the last path segment
+    out of ``path``, so ``"apartments.com/a;b"`` normalizes to ``"apartments.com/a"``. When the
+    URL's netloc matches ``target_domain``, returns ``(parsed, "")`` so the caller can proceed
+    with its domain-specific normalization. Otherwise returns ``(None, fallback)`` where
+    fallback is a basic-normalized "netloc + path[?query]" string with any trailing slash
+    stripped — this is the form domain matchers return as-is for off-domain URLs.
 
     Empty input returns ``(None, "")``.
     """
@@ -112,10 +124,8 @@ def basic_normalize_url(url: str, target_domain: str) -> tuple[ParseResult | Non
     parsed = urlparse("http://" + normalized)
 
     if target_domain not in parsed.netloc:
-        result = parsed.netloc + parsed.path
-        if parsed.query:
-            result += "?" + parsed.query
-        return None, result.rstrip("/")
+        query = "?" + parsed.query if parsed.query else ""
+        return None, (parsed.netloc + parsed.path + query).rstrip("/")
     return parsed, ""
 
 
@@ -166,18 +176,25 @@ def unwrap_single_template_query(
     ``_render_placeholders_in_queries_all`` each repeated verbatim (mode='all' multi-date
     expansion only supports a single templated query/URL) before diverging into their own
     per-placeholder expansion logic. ``group_message``/``item_message`` are the exact
-    ``AssertionError`` text each caller already used, kept caller-specific since they name the
-    domain-specific unit (e.g. "candidate object", "URL").
+    ``ValueError`` text each caller already used, kept caller-specific since they name the
+    domain-specific unit (e.g. "candidate object", "URL"). Raised rather than asserted so the
+    check still runs under ``python -O``.
     """
-    assert len(template_query) == 1, group_message
-    assert len(template_query[0]) == 1, item_message
+    if len(template_query) != 1:
+        raise ValueError(group_message)
+    if len(template_query[0]) != 1:
+        raise ValueError(item_message)
     return template_query[0][0]
 
 
+@cache
 def omni_import(path: str):
     """
     Import a module, class, function, or attribute given its absolute path.
 
+    Results are memoized per path, since ``instantiate`` resolves the same ``_target_`` strings
+    over and over when loading a dataset. Failed imports raise and are therefore not cached.
+
     Parameters:
         path (str): The absolute path in the form 'package.module.ClassName'
                     or even deeper nested objects.
@@ -214,6 +231,10 @@ def omni_import(path: str):
     raise ImportError(f"Could not import anything from '{path}'.")
 
 
+# Config node types `instantiate` recurses into; anything else is a leaf returned as-is.
+_CONTAINERS = (dict, list, tuple)
+
+
 def instantiate(
     config: Any, args: Iterable[Any] | None = None, kwargs: dict | None = None, recursive: bool | None = None
 ) -> Any:
@@ -237,20 +258,26 @@ def instantiate(
         # Config node itself specifies recursive=False. Return the config as is
         return config
 
-    # Recursively instantiate by default
+    # Recursively instantiate by default. Non-container leaves would be returned as-is by the
+    # final branch, so they are passed through inline rather than recursed into; configs are
+    # mostly leaves, so this skips the bulk of the recursive calls.
     if isinstance(config, (tuple, list)):
-        return [instantiate(item, recursive=recursive) for item in config]
+        return [instantiate(v, recursive=recursive) if isinstance(v, _CONTAINERS) else v for v in config]
     elif isinstance(config, dict):
         if "_target_" in config:
             if args is None:
                 args = config.get("_args_", [])
             if kwargs is None:
                 kwargs = {k: v for k, v in config.items() if k not in ("_target_", "_args_", "_recursive_")}
-            args = [instantiate(arg, recursive=recursive) for arg in args]
-            kwargs = {k: instantiate(v, recursive=recursive) for k, v in kwargs.items()}
+            args = [instantiate(v, recursive=recursive) if isinstance(v, _CONTAINERS) else v for v in args]
+            kwargs = {
+                k: instantiate(v, recursive=recursive) if isinstance(v, _CONTAINERS) else v for k, v in kwargs.items()
+            }
             return omni_import(config["_target_"])(*args, **kwargs)  # type: ignore
         else:
-            return {k: instantiate(v, recursive=recursive) for k, v in config.items()}
+            return {
+                k: instantiate(v, recursive=recursive) if isinstance(v, _CONTAINERS) else v for k, v in config.items()
+            }
     else:
         return config
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from beartype import beartype
@@ -19,6 +20,16 @@ from navi_bench.dates import initialize_user_metadata
 IGNORE_URL_PARAMS = ("isTrusted",)
 
 
+@lru_cache(maxsize=4096)
+def _parse_query_items(url: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Parse ``url``'s filtered query params into a hashable (and therefore cacheable) form.
+
+    The same URLs recur across update() calls and metric instances (including the GT URLs), so
+    each distinct URL is only run through urlparse/parse_qs once per process.
+    """
+    return tuple((k, tuple(v)) for k, v in parse_filtered_query_params(urlparse(url).query, IGNORE_URL_PARAMS).items())
+
+
 @beartype
 class CraigslistUrlMatch(ResetsViaState):
     def __init__(self, gt_urls: list[list[str]]) -> None:
@@ -33,10 +44,14 @@ class CraigslistUrlMatch(ResetsViaState):
         self.gt_urls = gt_urls
 
         self._gt_states = [[self._parse_state(url) for url in urls] for urls in gt_urls]
+        self._gt_state_keys = [[self._url_state_key(url) for url in urls] for urls in gt_urls]
         self._reset_state()
 
     def _reset_state(self) -> None:
         self._intermediate_url_to_state = {}
+        # Hashable state key -> first intermediate URL producing it, so `compute` can test
+        # coverage of each GT state with a single lookup instead of scanning every visited URL.
+        self._intermediate_state_key_to_url = {}
 
     def __repr__(self) -> str:
         return repr_with_attr(self, "gt_urls")
@@ -47,27 +62,26 @@ class CraigslistUrlMatch(ResetsViaState):
         if url not in self._intermediate_url_to_state:
             state = self._parse_state(url)
             self._intermediate_url_to_state[url] = state
+            self._intermediate_state_key_to_url.setdefault(self._url_state_key(url), url)
             logger.info(f"CraigslistUrlMatch.update: {url=}, {state=}")
 
     async def compute(self) -> FinalResult:
         n_covered = 0
+        # Nothing can be covered before any URL is visited, so skip scanning the GT groups entirely
+        gt_state_keys = self._gt_state_keys if self._intermediate_state_key_to_url else []
         # First level of iteration: all the elements in `self.gt_urls` are required to be covered
-        for i, candidate_gt_states in enumerate(self._gt_states):
-            # Second level of iteration: good if any of the elements in `candidate_gt_states` is covered
-            for j, gt_state in enumerate(candidate_gt_states):
-                is_covered = False
-                for intermediate_url, intermediate_state in self._intermediate_url_to_state.items():
-                    if intermediate_state == gt_state:  # dicts need to be exactly the same
-                        is_covered = True
-                        n_covered += 1
-                        logger.info(
-                            f"CraigslistUrlMatch.compute found {i}-th candidate URL covered:\n"
-                            f"    intermediate_url: {intermediate_url}\n"
-                            f"    gt_url: {self.gt_urls[i][j]}\n"
-                            f"    gt_state: {gt_state}"
-                        )
-                        break
-                if is_covered:
+        for i, candidate_gt_state_keys in enumerate(gt_state_keys):
+            # Second level of iteration: good if any of the elements in `candidate_gt_state_keys` is covered
+            for j, gt_state_key in enumerate(candidate_gt_state_keys):
+                intermediate_url = self._intermediate_state_key_to_url.get(gt_state_key)
+                if intermediate_url is not None:  # states need to be exactly the same
+                    n_covered += 1
+                    logger.info(
+                        f"CraigslistUrlMatch.compute found {i}-th candidate URL covered:\n"
+                        f"    intermediate_url: {intermediate_url}\n"
+                        f"    gt_url: {self.gt_urls[i][j]}\n"
+                        f"    gt_state: {self._gt_states[i][j]}"
+                    )
                     break
 
         n_required = len(self._gt_states)
@@ -77,7 +91,12 @@ class CraigslistUrlMatch(ResetsViaState):
 
     @staticmethod
     def _parse_state(url: str) -> dict:
-        return parse_filtered_query_params(urlparse(url).query, IGNORE_URL_PARAMS)
+        return {k: list(v) for k, v in _parse_query_items(url)}
+
+    @staticmethod
+    def _url_state_key(url: str) -> frozenset:
+        """Hashable form of ``url``'s parsed state; two keys are equal iff the state dicts are equal."""
+        return frozenset(_parse_query_items(url))
 
 
 def generate_task_config(
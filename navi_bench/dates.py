@@ -1,7 +1,9 @@
 """Unified utilities for parsing and evaluating dynamic date expressions."""
 
 import re
+from bisect import bisect_left
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from navi_bench.base import UserMetadata
@@ -34,19 +36,43 @@ _DYNAMIC_OFFSET_PATTERN = re.compile(
     re.VERBOSE,
 )
 
+# "{name}" placeholders in a task statement, substituted by `render_task_statement`.
+_TASK_PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+
+# Ordinal suffix for every `value % 100`, precomputed so `_ordinal_suffix` is a single index.
+_ORDINAL_SUFFIXES = tuple("th" if 10 <= i <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(i % 10, "th") for i in range(100))
+
 
 def _ordinal_suffix(value: int) -> str:
     """Return the ordinal suffix for a day number."""
-    if 10 <= value % 100 <= 20:
-        return "th"
-    return {1: "st", 2: "nd", 3: "rd"}.get(value % 10, "th")
+    return _ORDINAL_SUFFIXES[value % 100]
+
+
+# English month names indexed by ``date.month``, used instead of ``strftime("%B")``/``("%b")``
+# so natural-language dates skip format parsing and don't depend on the process locale.
+_MONTH_NAMES = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
 
 def _format_month_day(d: date, include_month: bool = True, month_style: str = "short", year_style: str = "none") -> str:
     suffix = _ordinal_suffix(d.day)
     if include_month:
-        month_fmt = "%b" if month_style == "short" else "%B"
-        date_str = f"{d.strftime(month_fmt)} {d.day}{suffix}"
+        month_name = _MONTH_NAMES[d.month]
+        date_str = f"{month_name[:3] if month_style == 'short' else month_name} {d.day}{suffix}"
         if year_style == "set":
             date_str += f", {d.year}"
         return date_str
@@ -60,7 +86,12 @@ def format_natural_date(d: date) -> str:
     natural-language task descriptions, which previously hand-rolled the identical
     ``strftime("%B %d, %Y")`` call in each file.
     """
-    return d.strftime("%B %d, %Y")
+    return f"{format_month_day(d)}, {d.year}"
+
+
+def format_month_day(d: date) -> str:
+    """Format a date's full month name and zero-padded day, e.g. "November 05"."""
+    return f"{_MONTH_NAMES[d.month]} {d.day:02d}"
 
 
 def _format_placeholder_span(start_date: date, end_date: date, month_style: str, year_style: str = "none") -> str:
@@ -94,10 +125,9 @@ def _parse_dynamic_options(raw: str | None) -> dict[str, str]:
         text = part.strip()
         if not text:
             continue
-        if "=" not in text:
+        key, sep, value = text.partition("=")
+        if not sep:
             raise ValueError(f"Invalid dynamic placeholder option '{text}'. Expected key=value.")
-
-        key, value = text.split("=", 1)
         options[key.strip().lower()] = value.strip().lower()
     return options
 
@@ -137,49 +167,68 @@ def resolve_placeholder_values(
     The third tuple element (``is_dynamic``) tells callers which branch produced
     the result so they don't need to re-run the regex to dispatch on it.
     """
-    stripped = text.strip()
-
     # Check for dynamic offset pattern first, fallback to string parsing
+    resolved = _resolve_dynamic_offset(text.strip(), base_date)
+    if resolved is not None:
+        description, iso_dates = resolved
+        return description, list(iso_dates), True
+
+    # Fallback to string parsing
+    return text, list(_parse_relative_iso_dates(text, base_date)), False
+
+
+@lru_cache(maxsize=2048)
+def _parse_relative_iso_dates(text: str, base_date: date) -> tuple[str, ...]:
+    """``parse_relative_dates`` as ISO strings, memoized like :func:`_resolve_dynamic_offset`:
+    a batch of dataset rows resolves the same descriptions against the same base date."""
+    return tuple(parse_relative_dates(text, base=base_date, return_iso=True))
+
+
+@lru_cache(maxsize=2048)
+def _resolve_dynamic_offset(stripped: str, base_date: date) -> tuple[str, tuple[str, ...]] | None:
+    """Resolve a ``{now() + timedelta(...)}`` expression into (description, ISO dates).
+
+    Returns None if ``stripped`` is not a dynamic offset expression. Memoized because task
+    generation resolves the same placeholder templates against the same base date for many
+    dataset rows; invalid expressions raise and are therefore not cached.
+    """
     match = _DYNAMIC_OFFSET_PATTERN.fullmatch(stripped)
-    if match:
-        start = int(match.group("start"))
-        end = int(match.group("end") or match.group("start"))
-        if end < start:
-            raise ValueError("timedelta end offset cannot be smaller than the start offset")
-
-        options = _parse_dynamic_options(match.group("options"))
-        month_style = _get_validated_option(
-            options, "month", "short", _MONTH_STYLE_OPTIONS, label="month style"
-        )
-        range_mode = _get_validated_option(options, "range", "all", _RANGE_OPTIONS)
-
-        offsets = range(start, end + 1)
-        start_date = base_date + timedelta(days=start)
-        end_date = base_date + timedelta(days=end)
-
-        if range_mode == "endpoints":
-            iso_dates = [start_date.isoformat(), end_date.isoformat()]
-        else:
-            iso_dates = [(base_date + timedelta(days=offset)).isoformat() for offset in offsets]
+    if not match:
+        return None
 
-        year_style = _get_validated_option(options, "year", "none", _YEAR_OPTIONS)
-        prefix_mode = _get_validated_option(options, "prefix", "auto", _PREFIX_OPTIONS)
+    start = int(match.group("start"))
+    end = int(match.group("end") or match.group("start"))
+    if end < start:
+        raise ValueError("timedelta end offset cannot be smaller than the start offset")
 
-        if prefix_mode == "none":
-            prefix = ""
-        elif prefix_mode == "next":
-            prefix = "next "
-        elif prefix_mode == "auto":
-            prefix = "next " if start >= 1 else ""
+    options = _parse_dynamic_options(match.group("options"))
+    month_style = _get_validated_option(options, "month", "short", _MONTH_STYLE_OPTIONS, label="month style")
+    range_mode = _get_validated_option(options, "range", "all", _RANGE_OPTIONS)
 
-        description = (
-            prefix + _format_placeholder_span(start_date, end_date, month_style=month_style, year_style=year_style)
-        ).strip()
-        return description, iso_dates, True
+    start_date = base_date + timedelta(days=start)
+    end_date = base_date + timedelta(days=end)
 
-    # Fallback to string parsing
-    dates = parse_relative_dates(text, base=base_date, return_iso=True)
-    return text, dates, False
+    if range_mode == "endpoints":
+        iso_dates = [start_date.isoformat(), end_date.isoformat()]
+    else:
+        # Step through integer ordinals rather than building a timedelta per day
+        start_ordinal = start_date.toordinal()
+        iso_dates = [date.fromordinal(start_ordinal + i).isoformat() for i in range(end - start + 1)]
+
+    year_style = _get_validated_option(options, "year", "none", _YEAR_OPTIONS)
+    prefix_mode = _get_validated_option(options, "prefix", "auto", _PREFIX_OPTIONS)
+
+    if prefix_mode == "none":
+        prefix = ""
+    elif prefix_mode == "next":
+        prefix = "next "
+    elif prefix_mode == "auto":
+        prefix = "next " if start >= 1 else ""
+
+    description = (
+        prefix + _format_placeholder_span(start_date, end_date, month_style=month_style, year_style=year_style)
+    ).strip()
+    return description, tuple(iso_dates)
 
 
 def render_task_statement(task: str, resolved_placeholders: dict[str, tuple[str, list[str]]]) -> str:
@@ -187,16 +236,15 @@ def render_task_statement(task: str, resolved_placeholders: dict[str, tuple[str,
     No fallback values for now.
     """
 
-    result = task
-    placeholders = re.findall(r"\{(\w+)\}", task)
-
-    for placeholder in placeholders:
-        if placeholder in resolved_placeholders:
-            resolved_description, _ = resolved_placeholders[placeholder]
-            result = result.replace(f"{{{placeholder}}}", resolved_description)
-        else:
+    def _substitute(match: re.Match[str]) -> str:
+        placeholder = match.group(1)
+        if placeholder not in resolved_placeholders:
             raise ValueError(f"Placeholder '{placeholder}' not found in resolved_placeholders")
-    return result
+        resolved_description, _ = resolved_placeholders[placeholder]
+        return resolved_description
+
+    # Single pass over the task text rather than one full-string replace per placeholder
+    return _TASK_PLACEHOLDER_PATTERN.sub(_substitute, task)
 
 
 def ensure_resolved_dates(dates: list[str], placeholder_key: str) -> None:
@@ -210,6 +258,16 @@ def ensure_resolved_dates(dates: list[str], placeholder_key: str) -> None:
         raise ValueError(f"No future dates resolved for placeholder '{placeholder_key}'")
 
 
+@lru_cache(maxsize=64)
+def _zone_info(key: str) -> ZoneInfo:
+    """Return the ``ZoneInfo`` for ``key``, holding a strong reference to every zone used.
+
+    ``ZoneInfo`` only strongly caches a handful of recent zones itself, so a dataset cycling
+    through more timezones than that would otherwise keep reloading tzdata.
+    """
+    return ZoneInfo(key)
+
+
 def initialize_user_metadata(
     timezone: str,
     location: str,
@@ -228,7 +286,7 @@ def resolve_city_now(city_meta: dict) -> tuple[datetime, UserMetadata]:
     the already-computed ``today``'s timestamp explicitly) instead of re-building the same
     ``location``/``timezone``/``timestamp`` object inline, as this function previously did.
     """
-    tz_info = ZoneInfo(city_meta["timezone"])
+    tz_info = _zone_info(city_meta["timezone"])
     today = datetime.now(tz_info)
     user_metadata = initialize_user_metadata(
         city_meta["timezone"], city_meta["location"], timestamp=int(today.timestamp())
@@ -238,7 +296,7 @@ def resolve_city_now(city_meta: dict) -> tuple[datetime, UserMetadata]:
 
 def user_metadata_datetime(user_metadata: UserMetadata) -> datetime:
     """Reconstruct the tz-aware datetime a UserMetadata's timestamp/timezone pair represents."""
-    return datetime.fromtimestamp(user_metadata.timestamp, ZoneInfo(user_metadata.timezone))
+    return datetime.fromtimestamp(user_metadata.timestamp, _zone_info(user_metadata.timezone))
 
 
 def initialize_placeholder_map(
@@ -253,9 +311,9 @@ def initialize_placeholder_map(
         resolved_desc, iso_dates, is_dynamic = resolve_placeholder_values(relative_description, base_date)
 
         if is_dynamic:
-            # Dynamic expressions are always correct; just filter past dates
-            today = base_date.isoformat()
-            iso_dates = [d for d in iso_dates if d >= today]
+            # Dynamic expressions are always correct; just filter past dates. Their ISO dates are
+            # generated in ascending order, so the past ones form a prefix we can bisect off.
+            iso_dates = iso_dates[bisect_left(iso_dates, base_date.isoformat()) :]
         else:
             # String-parsed dates from parse_relative_date(s) are already resolved to the
             # correct calendar year(s) (including any "bump into next/last year" already
@@ -1,8 +1,8 @@
 import base64
 import binascii
+import re
 import urllib.parse
-from collections import defaultdict
-from copy import deepcopy
+from functools import lru_cache
 from typing import Any
 
 from beartype import beartype
@@ -29,6 +29,58 @@ protoc --python_out=. google_flights.proto
 """
 
 
+# Shape check for GT segment dates, which must already be resolved to YYYY-MM-DD.
+_ISO_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _find_query_param(url: str, key: str) -> str | None:
+    """Return the first non-blank value of query param ``key`` in ``url``, or None.
+
+    Equivalent to ``parse_qs(urlparse(url).query).get(key, [None])[0]`` for the single
+    parameter we need, but scans the ``&``-separated pairs directly instead of building the
+    full parsed-query dict.
+    """
+    prefix = key + "="
+    query = url.partition("#")[0].partition("?")[2]
+    for pair in query.split("&"):
+        if pair.startswith(prefix) and len(pair) > len(prefix):
+            return urllib.parse.unquote_plus(pair[len(prefix) :])
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _decode_flight_info(url: str) -> Info | None:
+    """Decode the flight search encoded in a Google Flights search URL's ``tfs`` param.
+
+    Memoized per URL since the same URLs recur across ``update()`` calls and metric instances.
+    The returned ``Info`` is shared between callers and must not be mutated.
+    """
+    # Must also be a "search" page; also reject URLs that cannot carry a tfs param before scanning
+    if "/flights/search" not in url or "tfs=" not in url:
+        return None
+
+    tfs_param = _find_query_param(url, "tfs")
+
+    # Prevent value error
+    if not tfs_param:
+        return None
+
+    flight_info = Info()
+    padded = tfs_param + "=" * (-len(tfs_param) % 4)
+    try:
+        raw_bytes = base64.urlsafe_b64decode(padded)
+    except binascii.Error as e:
+        raise ValueError(f"Base64 decoding failed: {e}") from e
+
+    # Note, city locations parse to something like /m/01ly5m but are deterministic and
+    # can be used for location matching
+    flight_info.ParseFromString(raw_bytes)
+
+    # Unknown fields are ignored for comparison
+    flight_info.DiscardUnknownFields()
+    return flight_info
+
+
 @beartype
 class GoogleFlightsSearchMatch(ResetsViaState):
     def __init__(self, gt_info: list[dict]) -> None:
@@ -74,49 +126,29 @@ class GoogleFlightsSearchMatch(ResetsViaState):
 
         # these must parse successfully, otherwise an exception will be raised
         self._gt_base_info = [self._create_base_info(gt_info) for gt_info in gt_info]
+        # Deterministic serializations compare equal iff the messages do, turning `compute`'s
+        # field-by-field protobuf comparisons into bytes lookups.
+        self._gt_serialized = [info.SerializeToString(deterministic=True) for info in self._gt_base_info]
 
         self._reset_state()
 
     def _reset_state(self) -> None:
-        self._url_to_flight_info = defaultdict(Info)
+        self._url_to_flight_info: dict[str, Info] = {}
 
     def __repr__(self) -> str:
         return repr_with_attr(self, "_gt_base_info", label="gt_info")
 
     @classmethod
     def _decode_google_flights_url(cls, url: str) -> Info | None:
-        parsed = urllib.parse.urlparse(url)
-        query = urllib.parse.parse_qs(parsed.query)
-        tfs_param = query.get("tfs", [None])[0]
-
-        # Must also be a "search" page
-        if "/flights/search" not in url:
-            return None
-
-        # Prevent value error
-        if not tfs_param:
-            return None
-
-        flight_info = Info()
-        padded = tfs_param + "=" * (-len(tfs_param) % 4)
-        try:
-            raw_bytes = base64.urlsafe_b64decode(padded)
-        except binascii.Error as e:
-            raise ValueError(f"Base64 decoding failed: {e}") from e
-
-        # Note, city locations parse to something like /m/01ly5m but are deterministic and
-        # can be used for location matching
-        flight_info.ParseFromString(raw_bytes)
-
-        # Unknown fields are ignored for comparison
-        flight_info.DiscardUnknownFields()
-        return flight_info
+        return _decode_flight_info(url)
 
     @classmethod
     def _create_base_info(cls, gt_info: dict) -> Info:
         info = Info()
 
         for segment in gt_info["segments"]:
+            if not _ISO_DATE_PATTERN.fullmatch(segment["date"]):
+                raise ValueError(f"Segment date must be formatted as YYYY-MM-DD, got {segment['date']!r}")
             data = info.data.add()
             data.date = segment["date"]
             if "max_stops" in segment:
@@ -149,18 +181,20 @@ class GoogleFlightsSearchMatch(ResetsViaState):
         # Track which Info objects have been covered
         is_info_covered = [False] * len(self._gt_base_info)
 
+        # Index the visited URLs by serialized Info, keeping the first URL for each
+        serialized_to_url = {}
+        for url, flight_info in self._url_to_flight_info.items():
+            serialized_to_url.setdefault(flight_info.SerializeToString(deterministic=True), url)
+
         # Every Info object in `self._gt_base_info` must be covered
-        for i, gt_info in enumerate(self._gt_base_info):
-            # Iterate over
-            for url, flight_info in self._url_to_flight_info.items():
-                # compare on the FlightInfo, which compares field by field
-                if flight_info == gt_info:
-                    is_info_covered[i] = True
-                    logger.info(
-                        f"GoogleFlightsUrlMatch.compute found match for query {i}: "
-                        f"url={url}, flight_info={flight_info}, GT={gt_info}"
-                    )
-                    break
+        for i, (gt_info, gt_serialized) in enumerate(zip(self._gt_base_info, self._gt_serialized)):
+            url = serialized_to_url.get(gt_serialized)
+            if url is not None:
+                is_info_covered[i] = True
+                logger.info(
+                    f"GoogleFlightsUrlMatch.compute found match for query {i}: "
+                    f"url={url}, flight_info={self._url_to_flight_info[url]}, GT={gt_info}"
+                )
 
         # Score is 1.0 only if all infos are covered
         return all_or_nothing_coverage_result("GoogleFlightsUrlMatch", is_info_covered)
@@ -176,23 +210,30 @@ def resolve_date_references(gt_info: list[dict], resolved_values: dict[str, Any]
     Returns:
         List of gt_info dicts with resolved dates
     """
-    resolved_gt_info = deepcopy(gt_info)
-
-    for info_item in resolved_gt_info:
-        for segment in info_item["segments"]:
-            date_ref = segment["date"]
-
-            # Parse date reference (e.g., "dateRange.0" or "departureDate")
-            if "." in date_ref:
-                # It's an indexed reference like "dateRange.0"
-                key, index = date_ref.split(".", 1)
-                index = int(index)
-                segment["date"] = resolved_values[key][index]
-            else:
-                # It's a direct reference like "departureDate"
-                segment["date"] = resolved_values[date_ref]
-
-    return resolved_gt_info
+    # Only segment dates change, so rebuild just the info/segment dicts instead of deep-copying
+    # everything; the remaining (unchanged) values are shared with `gt_info`.
+    return [
+        {
+            **info_item,
+            "segments": [_resolve_segment_date(segment, resolved_values) for segment in info_item["segments"]],
+        }
+        for info_item in gt_info
+    ]
+
+
+def _resolve_segment_date(segment: dict, resolved_values: dict[str, Any]) -> dict:
+    """Return a copy of ``segment`` with its date reference replaced by the resolved date."""
+    date_ref = segment["date"]
+
+    # Parse date reference (e.g., "dateRange.0" or "departureDate")
+    key, sep, index = date_ref.partition(".")
+    if sep:
+        # It's an indexed reference like "dateRange.0"
+        resolved = resolved_values[key][int(index)]
+    else:
+        # It's a direct reference like "departureDate"
+        resolved = resolved_values[date_ref]
+    return {**segment, "date": resolved}
 
 
 def generate_task_config(
@@ -3,8 +3,9 @@ import functools
 import itertools
 import random
 import re
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable, Iterator
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from typing import Any, Literal
 
 from beartype import beartype
@@ -26,6 +27,7 @@ from navi_bench.base import (
 )
 from navi_bench.dates import (
     ensure_resolved_dates,
+    format_month_day,
     format_natural_date,
     initialize_placeholder_map,
     initialize_user_metadata,
@@ -76,6 +78,83 @@ class FinalResult(BaseModel):
     is_query_covered: list[bool]
 
 
+def _lowercase_names(names: list[str | None] | None) -> frozenset[str] | None:
+    """Lowercased ``restaurant_names`` as a frozenset, or None when the list is absent, empty, or
+    holds only None entries (the ``[None]`` that ``_render_placeholders_in_queries_all`` renders
+    for a template without names, i.e. no name constraint, as in ``_is_exhausted``).
+    """
+    if not names:
+        return None
+    return frozenset(name.lower() for name in names if name is not None) or None
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_time_to_timestamp(date: str, time: str) -> float:
+    """Memoized ``YYYY-MM-DD`` + ``HH:MM:SS`` -> POSIX timestamp; the same query and info
+    date/time strings are converted over and over across infos and ``update()`` calls.
+
+    Zero-padded values (everything the JS emits) have their fields sliced out directly.
+    Anything else, e.g. the ``"9:00:00"`` query time ``normalize_time_string`` makes from a
+    ``"9:00"`` meal time, goes through ``datetime.strptime``, which accepts unpadded fields.
+    """
+    if len(date) == 10 and len(time) == 8 and date[4] == date[7] == "-" and time[2] == time[5] == ":":
+        return datetime(
+            int(date[0:4]), int(date[5:7]), int(date[8:10]), int(time[0:2]), int(time[3:5]), int(time[6:8])
+        ).timestamp()
+    return datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M:%S").timestamp()
+
+
+@functools.lru_cache(maxsize=1024)
+def _sorted_query_timestamps(query_dates: tuple[str, ...], query_times: tuple[str, ...]) -> tuple[float, ...]:
+    """Sorted timestamps of every ``query_dates`` x ``query_times`` combination, so the window
+    checks in ``_match_query_window`` can bisect instead of scanning the cross product.
+    """
+    return tuple(sorted(_date_time_to_timestamp(date, time) for date in query_dates for time in query_times))
+
+
+@functools.lru_cache(maxsize=1024)
+def _info_message_kind(message: str) -> Literal["no_online_availability", "unavailable", "unfortunately", "available"]:
+    """Classify an info message by the first status phrase it contains, case-insensitively.
+
+    Memoized since the JS emits the same handful of messages for every slot and every
+    condition re-checks them.
+    """
+    message = message.lower()
+    if "no online availability" in message:
+        return "no_online_availability"
+    if "unavailable" in message:
+        return "unavailable"
+    if "unfortunately" in message:
+        return "unfortunately"
+    return "available"
+
+
+# Matches the "within N hours" window in a "no online availability" info message
+_WITHIN_HOURS_PATTERN = re.compile(r"within ([\d\.]+) hours")
+
+
+@functools.lru_cache(maxsize=1024)
+def _within_hours(info: str) -> float | None:
+    """Memoized N of a "within N hours" info message, or None when the message has no window."""
+    if "within " in info and (match := _WITHIN_HOURS_PATTERN.search(info)):
+        return float(match.group(1))
+    return None
+
+
+def _parse_date_time_range(date: str, time: str, info: str) -> tuple[float, float]:
+    """``[base - N hours, base + N hours]`` window for a "within N hours" info message.
+
+    Not memoized itself (its two lookups are), so the warning fires on every unparseable info.
+    """
+    base_ts = _date_time_to_timestamp(date, time)
+
+    if (hours := _within_hours(info)) is not None:
+        return (base_ts - hours * 3600, base_ts + hours * 3600)
+    else:
+        logger.warning(f"OpenTableInfoGathering could not parse date time range from info: {info}")
+        return base_ts, base_ts
+
+
 @beartype
 class OpenTableInfoGathering(ResetsViaState):
     """Gather restaurant availability information from OpenTable to evaluate query coverage"""
@@ -83,6 +162,31 @@ class OpenTableInfoGathering(ResetsViaState):
     def __init__(self, queries: list[list[MultiCandidateQuery]]) -> None:
         super().__init__()
         self.queries = queries
+        # lowercased ``restaurant_names`` per alternative condition (None when the condition has no
+        # name constraint), built once so per-info name checks are hash probes instead of list rebuilds
+        self._lowered_names: list[list[frozenset[str] | None]] = [
+            [_lowercase_names(condition.get("restaurant_names")) for condition in alternative_conditions]
+            for alternative_conditions in queries
+        ]
+        # lowercased restaurant name -> ``(i, j)`` of every alternative condition naming it, in
+        # query order, so the evidence handlers only visit conditions for the restaurant at hand
+        self._conditions_by_restaurant: dict[str, list[tuple[int, int]]] = {}
+        for i, lowered_names_per_condition in enumerate(self._lowered_names):
+            for j, lowered_names in enumerate(lowered_names_per_condition):
+                for name in lowered_names or ():
+                    self._conditions_by_restaurant.setdefault(name, []).append((i, j))
+        # ``(min, max)`` of each indexed condition's non-None ``dates``/``party_sizes`` (a None
+        # candidate never matches an info), so the evidence handlers compare against one bound
+        # instead of every candidate value
+        self._condition_bounds: dict[tuple[int, int], dict[str, tuple[Any, Any]]] = {
+            (i, j): {
+                key: (min(values), max(values))
+                for key in ("dates", "party_sizes")
+                if (values := [value for value in self.queries[i][j].get(key) or () if value is not None])
+            }
+            for pairs in self._conditions_by_restaurant.values()
+            for i, j in pairs
+        }
         self._reset_state()
 
     def _reset_state(self) -> None:
@@ -114,17 +218,22 @@ class OpenTableInfoGathering(ResetsViaState):
         marked covered in ``self._is_query_covered``.
 
         Centralizes the ``for i, alternative_conditions in enumerate(self.queries): if
-        self._is_query_covered[i]: continue`` guard that ``update``, ``compute``, and
-        ``_mark_uncovered_queries_with_unconditional_evidence`` each repeated verbatim before
-        their own domain-specific body. Lazily re-checks coverage at yield time, so it stays
-        behavior-identical to the inline guard even though each of those bodies may itself set
-        ``self._is_query_covered[i] = True`` for the *current* index while iterating.
+        self._is_query_covered[i]: continue`` guard that ``update`` and ``compute`` each
+        repeated verbatim before their own domain-specific body. Lazily re-checks coverage at
+        yield time, so it stays behavior-identical to the inline guard even though each of those
+        bodies may itself set ``self._is_query_covered[i] = True`` for the *current* index while
+        iterating.
         """
         for i, alternative_conditions in enumerate(self.queries):
             if not self._is_query_covered[i]:
                 yield i, alternative_conditions
 
     async def update(self, **kwargs) -> None:
+        # Once every query is covered nothing gathered from here on can change the result,
+        # so skip the page evaluation altogether
+        if all(self._is_query_covered):
+            return
+
         inputs: InputDict = kwargs
         page = inputs["page"]
         infos: list[InfoDict] = await safe_evaluate(
@@ -139,52 +248,43 @@ class OpenTableInfoGathering(ResetsViaState):
 
         # Check for "too far in advance" cases
         for info in infos:
-            if "take online reservations that far in advance" in info["info"].lower():
+            message = info["info"].lower()
+            if "take online reservations that far in advance" in message:
                 self._handle_too_far_in_advance(info)
 
-            if "your party is too small" in info["info"].lower():
+            if "your party is too small" in message:
                 self._handle_party_too_small_or_too_large(info, issue="too small")
 
-            if "your party is too large" in info["info"].lower():
+            if "your party is too large" in message:
                 self._handle_party_too_small_or_too_large(info, issue="too large")
 
+        info_names = [info["restaurantName"].lower() for info in infos]
         for i, alternative_conditions in self._iter_uncovered_queries():
-            for info in infos:
-                if self._check_alternative_conditions(i, alternative_conditions, info):
+            for info, info_name in zip(infos, info_names):
+                if self._check_alternative_conditions(i, alternative_conditions, info, info_name):
                     logger.info(
                         f"OpenTableInfoGathering.update found {i}-th query covered: {alternative_conditions=}, {info=}"
                     )
                     self._is_query_covered[i] = True
                     break
 
-    @staticmethod
-    def _condition_matches_restaurant(condition: MultiCandidateQuery, target_restaurant: str) -> bool:
-        """True iff ``condition`` explicitly names ``target_restaurant`` in its restaurant_names.
-
-        A condition with no ``restaurant_names`` key is treated as not matching: the
-        evidence-based handlers that call this (``_handle_too_far_in_advance``,
-        ``_handle_party_too_small_or_too_large``) only apply when the condition scoped
-        the expectation to specific restaurants. ``target_restaurant`` must already be
-        lowercased by the caller.
-        """
-        query_names = condition.get("restaurant_names")
-        if not query_names:
-            return False
-        return target_restaurant in (name.lower() for name in query_names)
-
     def _mark_uncovered_queries_with_unconditional_evidence(
         self,
         *,
         restaurant: str,
         condition_key: str,
-        all_satisfy: Callable[[Any], bool],
+        bounds_satisfy: Callable[[Any, Any], bool],
         on_covered: Callable[[int, MultiCandidateQuery], None],
     ) -> None:
         """Mark uncovered queries as covered when an evidence item rules them out unconditionally.
 
         For each uncovered query, look for an alternative condition that
-        (a) names ``restaurant`` explicitly and (b) has every value under
-        ``condition_key`` satisfying ``all_satisfy``. The first match marks
+        (a) names ``restaurant`` explicitly (a condition with no ``restaurant_names`` never
+        matches: these handlers only apply when the condition scoped the expectation to
+        specific restaurants; ``restaurant`` must already be lowercased), looked up via
+        ``self._conditions_by_restaurant``, and (b) has every value under
+        ``condition_key`` satisfying the predicate, which ``bounds_satisfy(min, max)`` decides
+        from the precomputed bounds of those values. The first match marks
         the query covered and invokes ``on_covered(i, alternative_condition)``
         so callers can emit their domain-specific log line.
 
@@ -193,14 +293,14 @@ class OpenTableInfoGathering(ResetsViaState):
         which share this iteration shape and only differ in the value predicate
         and the log line.
         """
-        for i, alternative_conditions in self._iter_uncovered_queries():
-            for alternative_condition in alternative_conditions:
-                if not self._condition_matches_restaurant(alternative_condition, restaurant):
-                    continue
-                if (values := alternative_condition.get(condition_key)) and all(all_satisfy(v) for v in values):
-                    on_covered(i, alternative_condition)
-                    self._is_query_covered[i] = True
-                    break
+        for i, j in self._conditions_by_restaurant.get(restaurant, ()):
+            # also skips the remaining conditions of a query once one of them covered it
+            if self._is_query_covered[i]:
+                continue
+            if (bounds := self._condition_bounds[i, j].get(condition_key)) and bounds_satisfy(*bounds):
+                alternative_condition = self.queries[i][j]
+                on_covered(i, alternative_condition)
+                self._is_query_covered[i] = True
 
     def _handle_too_far_in_advance(self, info: InfoDict) -> None:
         """Handle cases where dates are too far in advance to book.
@@ -222,7 +322,7 @@ class OpenTableInfoGathering(ResetsViaState):
         self._mark_uncovered_queries_with_unconditional_evidence(
             restaurant=too_far_restaurant,
             condition_key="dates",
-            all_satisfy=lambda d: d >= too_far_date,
+            bounds_satisfy=lambda min_date, _: min_date >= too_far_date,
             on_covered=_on_covered,
         )
 
@@ -241,7 +341,12 @@ class OpenTableInfoGathering(ResetsViaState):
         )
 
         op = "<=" if issue == "too small" else ">="
-        all_satisfy = (lambda s: s <= party_issue_size) if issue == "too small" else (lambda s: s >= party_issue_size)
+        # too small: every size <= the issue size, i.e. the max is; too large: the min is >= it
+        bounds_satisfy = (
+            (lambda _, max_size: max_size <= party_issue_size)
+            if issue == "too small"
+            else (lambda min_size, _: min_size >= party_issue_size)
+        )
 
         def _on_covered(i: int, alternative_condition: MultiCandidateQuery) -> None:
             logger.info(
@@ -253,7 +358,7 @@ class OpenTableInfoGathering(ResetsViaState):
         self._mark_uncovered_queries_with_unconditional_evidence(
             restaurant=party_issue_restaurant,
             condition_key="party_sizes",
-            all_satisfy=all_satisfy,
+            bounds_satisfy=bounds_satisfy,
             on_covered=_on_covered,
         )
 
@@ -280,12 +385,21 @@ class OpenTableInfoGathering(ResetsViaState):
         return final_result
 
     def _check_alternative_conditions(
-        self, i: int, alternative_conditions: list[MultiCandidateQuery], info: InfoDict
+        self, i: int, alternative_conditions: list[MultiCandidateQuery], info: InfoDict, info_name: str
     ) -> bool:
-        """Check if any of the alternative conditions is available and covered by the info"""
+        """Check if any of the alternative conditions is available and covered by the info
+
+        ``info_name`` is ``info["restaurantName"]`` already lowercased by the caller.
+        """
         for j, alternative_condition in enumerate(alternative_conditions):
             evidences = self._unavailable_evidences[i][j]
-            if self._check_multi_candidate_query(alternative_condition, info, evidences):
+            if self._check_multi_candidate_query(
+                alternative_condition,
+                info,
+                evidences,
+                lowered_names=self._lowered_names[i][j],
+                info_name=info_name,
+            ):
                 return True
         return False
 
@@ -315,16 +429,14 @@ class OpenTableInfoGathering(ResetsViaState):
         which only cares about ``matched`` -- see that method for why the branch is irrelevant
         there).
         """
-        available_info = info["info"].lower()
+        message_kind = _info_message_kind(info["info"])
 
-        if "no online availability" in available_info:
+        if message_kind == "no_online_availability":
             if query_dates and query_times:
-                info_min_ts, info_max_ts = cls._parse_date_time_range(info["date"], info["time"], info["info"])
-                matched = any(
-                    info_min_ts <= cls._convert_date_time_to_timestamp(date, time) <= info_max_ts
-                    for date in query_dates
-                    for time in query_times
-                )
+                info_min_ts, info_max_ts = _parse_date_time_range(info["date"], info["time"], info["info"])
+                query_ts = _sorted_query_timestamps(tuple(query_dates), tuple(query_times))
+                k = bisect_left(query_ts, info_min_ts)
+                matched = k < len(query_ts) and query_ts[k] <= info_max_ts
             elif query_dates:
                 matched = info["date"] in query_dates
             elif query_times:
@@ -334,20 +446,18 @@ class OpenTableInfoGathering(ResetsViaState):
             return "no_online_availability", matched
 
         if (
-            "unavailable" in available_info
+            message_kind == "unavailable"
             and info.get("startDate")
             and info.get("startTime")
             and info.get("endDate")
             and info.get("endTime")
         ):
             if query_dates and query_times:
-                start_ts = cls._convert_date_time_to_timestamp(info["startDate"], info["startTime"])
-                end_ts = cls._convert_date_time_to_timestamp(info["endDate"], info["endTime"])
-                matched = any(
-                    start_ts <= cls._convert_date_time_to_timestamp(date, time) < end_ts
-                    for date in query_dates
-                    for time in query_times
-                )
+                start_ts = _date_time_to_timestamp(info["startDate"], info["startTime"])
+                end_ts = _date_time_to_timestamp(info["endDate"], info["endTime"])
+                query_ts = _sorted_query_timestamps(tuple(query_dates), tuple(query_times))
+                k = bisect_left(query_ts, start_ts)
+                matched = k < len(query_ts) and query_ts[k] < end_ts
             elif query_dates:
                 matched = any(info["startDate"] <= date < info["endDate"] for date in query_dates)
             elif query_times:
@@ -357,22 +467,34 @@ class OpenTableInfoGathering(ResetsViaState):
             return "range_unavailable", matched
 
         matched = (not query_dates or info["date"] in query_dates) and (not query_times or info["time"] in query_times)
-        if "unavailable" in available_info or "unfortunately" in available_info:
+        if message_kind != "available":
             return "plain_unavailable", matched
         return "available", matched
 
     @classmethod
     def _check_multi_candidate_query(
-        cls, query: MultiCandidateQuery, info: InfoDict, evidences: list[InfoDict]
+        cls,
+        query: MultiCandidateQuery,
+        info: InfoDict,
+        evidences: list[InfoDict],
+        *,
+        lowered_names: frozenset[str] | None = None,
+        info_name: str | None = None,
     ) -> bool:
         """Check if the multi-candidate query is available and covered by the info
 
         Returns True if the query is available and covered by the info. Otherwise, if the query is covered by
         the info yet unavailable, we need to collect the info as an evidence, before returning False.
+
+        ``lowered_names``/``info_name`` let ``update`` pass in the lowercased query names and info
+        restaurant name it already computed; both are derived here when omitted.
         """
-        if query_names := query.get("restaurant_names"):
-            query_names = [name.lower() for name in query_names]
-            if info["restaurantName"].lower() not in query_names:
+        if lowered_names is None:
+            lowered_names = _lowercase_names(query.get("restaurant_names"))
+        if lowered_names is not None:
+            if info_name is None:
+                info_name = info["restaurantName"].lower()
+            if info_name not in lowered_names:
                 return False
 
         if party_sizes := query.get("party_sizes"):
@@ -434,43 +556,111 @@ class OpenTableInfoGathering(ResetsViaState):
         query_dates = cls._singleton_choices(query, "dates")
         query_times = cls._singleton_choices(query, "times")
 
+        # Evidence from the two exact-match branches of ``_match_query_window`` covers a slot iff
+        # its fields equal the slot's constrained fields, so it is indexed into hashable slot keys
+        # (built lazily per combination of constrained axes). Window-based evidence covers a slot
+        # with both a date and a time iff the slot's timestamp falls in one of its windows, so it is
+        # grouped by name/party-size into bisectable interval unions; only slots missing a date or
+        # a time still scan it linearly.
+        exact_evidences: list[InfoDict] = []
+        window_evidences: list[tuple[str, InfoDict]] = []
+        for info in evidences:
+            branch, _ = cls._match_query_window(None, None, info)
+            if branch in ("no_online_availability", "range_unavailable"):
+                window_evidences.append((branch, info))
+            else:
+                exact_evidences.append(info)
+        covered_slots: dict[tuple[bool, bool, bool, bool], set[tuple]] = {}
+        covered_windows: dict[tuple[bool, bool], dict[tuple, _IntervalUnion]] = {}
+
         for query_name, query_party_size, query_date, query_time in itertools.product(
             query_names, query_party_sizes, query_dates, query_times
         ):
-            # check if the query slot is covered by any of the evidences
-            found_match = False
-            for info in evidences:
-                if cls._check_single_candidate_query(
-                    SingleCandidateQuery(
-                        restaurant_name=query_name,
-                        party_size=query_party_size,
-                        date=query_date,
-                        time=query_time,
-                    ),
-                    info,
-                ):
-                    found_match = True
-                    break
-
-            if not found_match:
+            # mirrors which fields ``_check_single_candidate_query`` treats as constrained
+            axes = (query_name is not None, query_party_size is not None, bool(query_date), bool(query_time))
+            if axes not in covered_slots:
+                covered_slots[axes] = {cls._evidence_slot(info, axes) for info in exact_evidences}
+            slot = (
+                query_name.lower() if axes[0] else None,
+                query_party_size if axes[1] else None,
+                query_date if axes[2] else None,
+                query_time if axes[3] else None,
+            )
+            if slot in covered_slots[axes]:
+                continue
+
+            if axes[2] and axes[3]:
+                if axes[:2] not in covered_windows:
+                    covered_windows[axes[:2]] = cls._window_evidence_unions(window_evidences, axes)
+                union = covered_windows[axes[:2]].get(slot[:2])
+                if union is None or not union.covers(_date_time_to_timestamp(query_date, query_time)):
+                    return False
+                continue
+
+            single_query = SingleCandidateQuery(
+                restaurant_name=query_name,
+                party_size=query_party_size,
+                date=query_date,
+                time=query_time,
+            )
+            if not any(cls._check_single_candidate_query(single_query, info) for _, info in window_evidences):
                 return False
 
         return True
 
-    @classmethod
-    def _convert_date_time_to_timestamp(cls, date: str, time: str) -> float:
-        return datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M:%S").timestamp()
+    @staticmethod
+    def _evidence_slot(info: InfoDict, axes: tuple[bool, bool, bool, bool]) -> tuple:
+        """The ``(name, party size, date, time)`` slot ``info`` covers, keeping only the fields
+        flagged in ``axes`` (the rest are None), for ``_is_exhausted``'s exact-match lookup.
+        """
+        return (
+            info["restaurantName"].lower() if axes[0] else None,
+            info["partySize"] if axes[1] else None,
+            info["date"] if axes[2] else None,
+            info["time"] if axes[3] else None,
+        )
 
     @classmethod
-    def _parse_date_time_range(cls, date: str, time: str, info: str) -> tuple[float, float]:
-        base_ts = cls._convert_date_time_to_timestamp(date, time)
+    def _window_evidence_unions(
+        cls, window_evidences: list[tuple[str, InfoDict]], axes: tuple[bool, bool, bool, bool]
+    ) -> dict[tuple, "_IntervalUnion"]:
+        """Group window-based evidence by its ``(name, party size)`` slot prefix (per ``axes``, as
+        in ``_evidence_slot``) into the union of timestamp windows it covers: the closed
+        "within N hours" window or the half-open ``[start, end)`` unavailable range.
+        """
+        intervals: dict[tuple, list[tuple[float, float, bool]]] = {}
+        for branch, info in window_evidences:
+            if branch == "no_online_availability":
+                lo, hi = _parse_date_time_range(info["date"], info["time"], info["info"])
+                interval = (lo, hi, True)
+            else:
+                start_ts = _date_time_to_timestamp(info["startDate"], info["startTime"])
+                interval = (start_ts, _date_time_to_timestamp(info["endDate"], info["endTime"]), False)
+            intervals.setdefault(cls._evidence_slot(info, axes)[:2], []).append(interval)
+        return {key: _IntervalUnion(group) for key, group in intervals.items()}
 
-        if match := re.search(r"within ([\d\.]+) hours", info):
-            hours = float(match.group(1))
-            return (base_ts - hours * 3600, base_ts + hours * 3600)
-        else:
-            logger.warning(f"OpenTableInfoGathering could not parse date time range from info: {info}")
-            return base_ts, base_ts
+
+class _IntervalUnion:
+    """Point-membership over a union of possibly-overlapping timestamp intervals.
+
+    Intervals are ``(lo, hi, hi_inclusive)`` and always include ``lo``. Sorted by ``lo`` with a
+    running maximum of ``(hi, hi_inclusive)``, so a point is covered iff the furthest-reaching
+    interval starting at or before it reaches it -- one bisect per lookup.
+    """
+
+    __slots__ = ("_los", "_reaches")
+
+    def __init__(self, intervals: list[tuple[float, float, bool]]) -> None:
+        intervals = sorted(intervals)
+        self._los = [lo for lo, _, _ in intervals]
+        self._reaches = list(itertools.accumulate(((hi, inclusive) for _, hi, inclusive in intervals), max))
+
+    def covers(self, ts: float) -> bool:
+        k = bisect_right(self._los, ts) - 1
+        if k < 0:
+            return False
+        hi, inclusive = self._reaches[k]
+        return ts < hi or (inclusive and ts == hi)
 
 
 # City to location and timezone mapping
@@ -513,6 +703,7 @@ class RestaurantDict(TypedDict):
     max_party_size: int
 
 
+@functools.lru_cache(maxsize=1024)
 def time_to_natural_language(time_str: str) -> str:
     """
     Convert time string like "18:00" or "18:30" to natural language like "6pm" or "6:30pm".
@@ -523,9 +714,9 @@ def time_to_natural_language(time_str: str) -> str:
     Returns:
         Natural language time string
     """
-    parts = time_str.split(":")
-    hour = int(parts[0])
-    minute = int(parts[1]) if len(parts) > 1 else 0
+    hour_str, _, rest = time_str.partition(":")
+    hour = int(hour_str)
+    minute = int(rest.partition(":")[0]) if rest else 0
 
     hour_12, period = hour_to_12h_period(hour)
 
@@ -549,9 +740,8 @@ def normalize_time_string(time_str: str) -> str:
     Returns:
         Time in HH:MM:SS format
     """
-    parts = time_str.split(":")
-    if len(parts) == 2:
-        return f"{parts[0]}:{parts[1]}:00"
+    if time_str.count(":") == 1:
+        return f"{time_str}:00"
     return time_str
 
 
@@ -628,8 +818,28 @@ def _format_weekend_span(sat: datetime, sun: datetime) -> str:
     instead of assuming both days share a month and printing a bare day number for Sunday.
     """
     if sat.month == sun.month:
-        return f"{sat.strftime('%B %d')}-{sun.day}"
-    return f"{sat.strftime('%B %d')} - {sun.strftime('%B %d')}"
+        return f"{format_month_day(sat)}-{sun.day}"
+    return f"{format_month_day(sat)} - {format_month_day(sun)}"
+
+
+def _next_two_weekends_offsets(today: datetime) -> list[int]:
+    """Combine the upcoming weekend and the following weekend."""
+    upcoming = get_next_weekend_offsets(today)
+    return upcoming + _one_week_later(upcoming)
+
+
+# Fixed date labels -> day-offsets function, looked up by ``get_days_until_date`` before it falls
+# back to parsing a "for the upcoming <weekday>" label
+_DATE_LABEL_OFFSETS: dict[str, Callable[[datetime], list[int]]] = {
+    "tomorrow": lambda today: [1],
+    "day after tomorrow": lambda today: [2],
+    "upcoming weekend": get_next_weekend_offsets,
+    # Get upcoming weekend first, then shift a week later
+    "the following weekend": lambda today: _one_week_later(get_next_weekend_offsets(today)),
+    "the next two weekends": _next_two_weekends_offsets,
+    "the first weekend of the next calendar month": get_first_weekend_of_next_month_offsets,
+    "the first weekend of next month": get_first_weekend_of_next_month_offsets,
+}
 
 
 def get_days_until_date(date_label: str, today: datetime) -> list[int]:
@@ -645,24 +855,11 @@ def get_days_until_date(date_label: str, today: datetime) -> list[int]:
     Returns:
         List of day offsets from today to the target date(s)
     """
-    if date_label == "tomorrow":
-        return [1]
-    elif date_label == "day after tomorrow":
-        return [2]
-    elif date_label == "upcoming weekend":
-        return get_next_weekend_offsets(today)
-    elif date_label == "the following weekend":
-        # Get upcoming weekend first, then shift a week later
-        return _one_week_later(get_next_weekend_offsets(today))
-    elif date_label == "the next two weekends":
-        # Combine upcoming weekend and following weekend
-        upcoming = get_next_weekend_offsets(today)
-        return upcoming + _one_week_later(upcoming)
-    elif date_label in {"the first weekend of the next calendar month", "the first weekend of next month"}:
-        return get_first_weekend_of_next_month_offsets(today)
+    if (offsets_for := _DATE_LABEL_OFFSETS.get(date_label)) is not None:
+        return offsets_for(today)
     elif date_label.startswith("for the upcoming "):
         # Extract weekday name
-        weekday_name = date_label.replace("for the upcoming ", "")
+        weekday_name = date_label.removeprefix("for the upcoming ")
         target_day = WEEKDAYS[weekday_name.lower()]
 
         # Calculate days until next occurrence of this weekday
@@ -674,6 +871,17 @@ def get_days_until_date(date_label: str, today: datetime) -> list[int]:
         raise ValueError(f"Unknown date label: {date_label}")
 
 
+@functools.lru_cache(maxsize=512)
+def _days_until_date_on(date_label: str, today_ordinal: int, tz: tzinfo | None) -> tuple[int, ...]:
+    """``get_days_until_date`` keyed on today's calendar date (as an ordinal) rather than the
+    full timestamp.
+
+    The offsets only depend on the date, so batch task generation, which keeps drawing the
+    same labels on the same day, reuses them instead of recomputing per task.
+    """
+    return tuple(get_days_until_date(date_label, datetime.fromordinal(today_ordinal).replace(tzinfo=tz)))
+
+
 def generate_task_config_random(
     restaurant: RestaurantDict,
     date_options: list[str] | None = None,
@@ -744,11 +952,11 @@ def generate_task_config_random(
 
     # Randomly select date option
     date_label = random.choice(available_date_options)
-    days_offsets = get_days_until_date(date_label, today)
+    days_offsets = _days_until_date_on(date_label, today.toordinal(), today.tzinfo)
 
     # Calculate the actual date(s)
     target_dates = [today + timedelta(days=offset) for offset in days_offsets]
-    date_strs = [d.strftime("%Y-%m-%d") for d in target_dates]
+    date_strs = [d.date().isoformat() for d in target_dates]
 
     # Format natural language date display
     if len(target_dates) == 1:
@@ -808,14 +1016,18 @@ def _render_placeholders_in_queries_any(
     Returns:
         Updated queries with placeholders replaced by date lists
     """
+    dates_by_template: dict[str, list[str]] = {}
     for placeholder_key, (_, dates) in resolved_placeholders.items():
-        template_string = "{" + placeholder_key + "}"
         ensure_resolved_dates(dates, placeholder_key)
+        dates_by_template["{" + placeholder_key + "}"] = dates
 
-        for query in queries:
-            for candidate_obj in query:
-                if "dates" in candidate_obj and candidate_obj["dates"] == template_string:
-                    candidate_obj["dates"] = dates
+    # One pass over the candidates regardless of the number of placeholders
+    for query in queries:
+        for candidate_obj in query:
+            if isinstance(template_string := candidate_obj.get("dates"), str) and (
+                dates := dates_by_template.get(template_string)
+            ):
+                candidate_obj["dates"] = dates
 
     return queries
 
@@ -838,23 +1050,27 @@ def _render_placeholders_in_queries_all(
         item_message="Only support one candidate object per query for now",
     )
 
-    queries = []
+    restaurant_names = template_query_dict.get("restaurant_names", [None])
+    times = template_query_dict.get("times", [None])
+    party_sizes = template_query_dict.get("party_sizes", [None])
+
+    queries: list[list[MultiCandidateQuery]] = []
     for placeholder_key, (_, dates) in resolved_placeholders.items():
         ensure_resolved_dates(dates, placeholder_key)
 
-        for date, restaurant_name, time, party_size in itertools.product(
-            dates,
-            template_query_dict.get("restaurant_names", [None]),
-            template_query_dict.get("times", [None]),
-            template_query_dict.get("party_sizes", [None]),
-        ):
-            query_dict: MultiCandidateQuery = {
-                "restaurant_names": [restaurant_name],
-                "dates": [date],
-                "times": [time],
-                "party_sizes": [party_size],
-            }
-            queries.append([query_dict])
+        queries.extend(
+            [
+                {
+                    "restaurant_names": [restaurant_name],
+                    "dates": [date],
+                    "times": [time],
+                    "party_sizes": [party_size],
+                }
+            ]
+            for date, restaurant_name, time, party_size in itertools.product(
+                dates, restaurant_names, times, party_sizes
+            )
+        )
 
     return queries
 
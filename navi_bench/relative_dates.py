@@ -1,6 +1,7 @@
 import calendar
 import re
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 # --------------------------
@@ -46,6 +47,7 @@ _DAY_NUM = r"(\d{1,2})(?:st|nd|rd|th)?"
 _MONTH_DAY_RANGE_PATTERN = re.compile(rf"(?:({_MOD_NONCAP}\s+)?([a-z.]+)\s+)?{_DAY_NUM}\s*-\s*{_DAY_NUM}")
 
 
+@lru_cache(maxsize=1024)
 def _days_in_month(year: int, month: int) -> int:
     return calendar.monthrange(year, month)[1]
 
@@ -160,23 +162,46 @@ HOLIDAYS = {
     "easter": easter_sunday,
 }
 
+# Holiday phrase -> ``HOLIDAYS`` key: every key as-is, plus "<key> day" for keys that don't
+# already have that form ("halloween day", "thanksgiving day"), so the holiday branch of
+# `parse_relative_date` resolves with one dict lookup.
+_HOLIDAY_KEYS = {key: key for key in HOLIDAYS}
+for _key in HOLIDAYS:
+    _HOLIDAY_KEYS.setdefault(f"{_key} day", _key)
+
+
+@lru_cache(maxsize=4096)
+def _resolve_holiday(key: str, year: int) -> date:
+    """``HOLIDAYS[key](year)``, memoized: batch parsing keeps resolving the same few years."""
+    return HOLIDAYS[key](year)
+
+
+# Patterns applied by `_canon`, in order.
+_UNICODE_DASH_PATTERN = re.compile(r"[–—-−]")  # en/em/non-breaking/minus → "-"
+_NON_DATE_CHAR_PATTERN = re.compile(r"[^\w\s',.-]")
+_CALENDAR_BEFORE_MONTH_PATTERN = re.compile(r"\bcalendar\s+(?=month\b)")
+
+# Optional ordinal suffixes on a day number, e.g. "5th" (same set as `_DAY_NUM`).
+_ORDINAL_SUFFIXES = frozenset({"st", "nd", "rd", "th"})
+
 
 # Canonicalization for keys
 def _canon(s: str) -> str:
-    s = s.lower().strip()
     # normalize unicode dashes to ASCII hyphen
-    s = re.sub(r"[–—-−]", "-", s)  # en/em/non-breaking/minus → "-"
+    s = _UNICODE_DASH_PATTERN.sub("-", s.lower().strip())
     # keep apostrophes, dots (Dec.), AND hyphens (11-14)
-    s = re.sub(r"[^\w\s',.-]", " ", s)
+    s = _NON_DATE_CHAR_PATTERN.sub(" ", s)
     # treat \"next calendar month\" the same as \"next month\" for parsing
-    s = re.sub(r"\bcalendar\s+(?=month\b)", "", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    if "calendar" in s:
+        s = _CALENDAR_BEFORE_MONTH_PATTERN.sub("", s)
+    # collapse whitespace runs and strip (str.split() splits on the same characters as \s)
+    return " ".join(s.split())
 
 
 def _parse_ordinal_day(tok: str) -> int | None:
-    m = re.fullmatch(_DAY_NUM, tok)
-    return int(m.group(1)) if m else None
+    # Same tokens as fullmatching `_DAY_NUM` ("5", "05", "5th"); isdecimal() is \d's class.
+    digits = tok[:-2] if tok[-2:] in _ORDINAL_SUFFIXES else tok
+    return int(digits) if 1 <= len(digits) <= 2 and digits.isdecimal() else None
 
 
 def _normalize_modifier(mod: str | None) -> str:
@@ -259,6 +284,52 @@ def _day_in_shifted_month(base: date, day: int, months_offset: int, return_iso:
 # ----------------------------------
 # Public API
 # ----------------------------------
+# `parse_relative_date` patterns, tried in this order against the canonicalized text.
+# A/B1-B4) month + day in either order, fused into one alternation whose branches are tried
+# in order; each is wrapped in a named group (the match's ``lastgroup``) with its own
+# ``<branch>_mod``/``_month``/``_day`` groups. Months are matched against the `MONTHS` keys
+# themselves (longest first), so a branch only matches when its month word is a real month.
+_MONTH_NAME = "(?:" + "|".join(re.escape(k) for k in sorted(MONTHS, key=len, reverse=True)) + ")"
+_MOD_ALTERNATION = "|".join(_MODIFIERS)
+_ORDINAL_DAY_BODY = r"\d{1,2}(?:st|nd|rd|th)?"
+_MONTH_AND_DAY_BRANCHES = {
+    # A) "next Dec. 3rd" / "this september 1" / "last jul 4th"
+    "a": rf"(?P<a_mod>{_MOD_ALTERNATION})?\s*(?P<a_month>{_MONTH_NAME})\s+(?P<a_day>{_ORDINAL_DAY_BODY})",
+    # B1) "this the 3rd of december" / "next 3rd of december"
+    "b1": (
+        rf"(?P<b1_mod>{_MOD_ALTERNATION})\s*(?:on\s+)?(?:the\s+)?(?P<b1_day>{_ORDINAL_DAY_BODY})"
+        rf"\s+(?:of\s+)?(?P<b1_month>{_MONTH_NAME})"
+    ),
+    # B2) "the 3rd of december next" / "3rd december upcoming"
+    "b2": (
+        rf"(?:on\s+)?(?:the\s+)?(?P<b2_day>{_ORDINAL_DAY_BODY})\s+(?:of\s+)?(?P<b2_month>{_MONTH_NAME})"
+        rf"\s+(?P<b2_mod>{_MOD_ALTERNATION})"
+    ),
+    # B3) "the 3rd next december" / "3rd next december"
+    "b3": (
+        rf"(?:on\s+)?(?:the\s+)?(?P<b3_day>{_ORDINAL_DAY_BODY})\s+(?P<b3_mod>{_MOD_ALTERNATION})"
+        rf"\s+(?P<b3_month>{_MONTH_NAME})"
+    ),
+    # B4) "the 3rd of december" / "3rd of dec." / "3rd december" (no modifier)
+    "b4": rf"(?:on\s+)?(?:the\s+)?(?P<b4_day>{_ORDINAL_DAY_BODY})\s+(?:of\s+)?(?P<b4_month>{_MONTH_NAME})",
+}
+_MONTH_AND_DAY_PATTERN = re.compile("|".join(f"(?P<{name}>{body})" for name, body in _MONTH_AND_DAY_BRANCHES.items()))
+# Any digit; gates forms A-E of parse_relative_date
+_DIGIT_PATTERN = re.compile(r"\d")
+# C) "26th of the next month" / "on the 26th next month" / "26th next month"
+_DAY_OF_MOD_MONTH_PATTERN = re.compile(
+    rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+(?:of\s+)?(?:the\s+)?{_MOD_GROUP}\s+month"
+)
+# D) "<D> in N months"
+_DAY_IN_N_MONTHS_PATTERN = re.compile(rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+in\s+(\d+)\s+months?")
+# E) "in N units" (days/weeks/months/years)
+_IN_N_UNITS_PATTERN = re.compile(r"in\s+(\d+)\s+(day|days|week|weeks|month|months|year|years)")
+# F) "(this|next|upcoming|last) <weekday>"
+_WEEKDAY_PATTERN = re.compile(rf"(?:the\s+)?{_MOD_GROUP}?\s*([a-z]+)")
+# G) "(this|next|upcoming|last) <holiday>"
+_HOLIDAY_PATTERN = re.compile(rf"(?:the\s+)?{_MOD_GROUP}?\s*(.+)")
+
+
 def parse_relative_date(text: str, base: date | None = None, return_iso: bool = True) -> str | date:
     """
     Parse a short relative-date description to a concrete date.
@@ -278,147 +349,111 @@ def parse_relative_date(text: str, base: date | None = None, return_iso: bool =
     raw = text.strip()
     s = _canon(raw)
 
-    # ----------------------------
-    # A) Month + day: "next Dec. 3rd" / "this september 1" / "last jul 4th"
-    # ----------------------------
-    m = re.fullmatch(rf"{_MOD_GROUP}?\s*([a-z.]+)\s+{_ORDINAL_DAY}", s)
-    if m and m.group(2) in MONTHS:
-        modifier = _normalize_modifier(m.group(1))
-        month = MONTHS[m.group(2)]
-        day = _parse_ordinal_day(m.group(3))
-        return _resolve_month_day(month, day, base, modifier, return_iso)
-
-    # ----------------------------
-    # B1) Day + 'of' + Month with leading modifier:
-    #     "this the 3rd of december" / "next 3rd of december"
-    # ----------------------------
-    m = re.fullmatch(
-        rf"{_MOD_GROUP}\s*(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+(?:of\s+)?([a-z.]+)",
-        s,
-    )
-    if m and m.group(3) in MONTHS:
-        modifier = _normalize_modifier(m.group(1))
-        day = _parse_ordinal_day(m.group(2))
-        month = MONTHS[m.group(3)]
-        return _resolve_month_day(month, day, base, modifier, return_iso)
-
-    # B2) Day + Month + trailing modifier:
-    #     "the 3rd of december next" / "3rd december upcoming"
-    m = re.fullmatch(
-        rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+(?:of\s+)?([a-z.]+)\s+{_MOD_GROUP}",
-        s,
-    )
-    if m and m.group(2) in MONTHS:
-        day = _parse_ordinal_day(m.group(1))
-        month = MONTHS[m.group(2)]
-        modifier = _normalize_modifier(m.group(3))
-        return _resolve_month_day(month, day, base, modifier, return_iso)
-
-    # B3) Day + modifier + Month:
-    #     "the 3rd next december" / "3rd next december"
-    m = re.fullmatch(rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+{_MOD_GROUP}\s+([a-z.]+)", s)
-    if m and m.group(3) in MONTHS:
-        day = _parse_ordinal_day(m.group(1))
-        modifier = _normalize_modifier(m.group(2))
-        month = MONTHS[m.group(3)]
-        return _resolve_month_day(month, day, base, modifier, return_iso)
-
-    # B4) Day + 'of' + Month with NO modifier:
-    #     "the 3rd of december" / "3rd of dec." / "3rd december"
-    m = re.fullmatch(rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+(?:of\s+)?([a-z.]+)", s)
-    if m and m.group(2) in MONTHS:
-        day = _parse_ordinal_day(m.group(1))
-        month = MONTHS[m.group(2)]
-        # no modifier -> default behavior: upcoming/on-or-after base
-        return _resolve_month_day(month, day, base, modifier="", return_iso=return_iso)
-
-    # ----------------------------
-    # C) "<D> of the <mod> month" AND loose variants:
-    #     "26th of the next month" (already) + "on the 26th next month" / "26th next month"
-    # ----------------------------
-    m = re.fullmatch(
-        rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+(?:of\s+)?(?:the\s+)?{_MOD_GROUP}\s+month",
-        s,
-    )
-    if m:
-        day = _parse_ordinal_day(m.group(1))
-        mod = _normalize_modifier(m.group(2))
-        return _day_in_shifted_month(base, day, _shift_for_modifier(mod), return_iso)
-
-    # ----------------------------
-    # D) "<D> in N months"
-    # ----------------------------
-    m = re.fullmatch(rf"(?:on\s+)?(?:the\s+)?{_ORDINAL_DAY}\s+in\s+(\d+)\s+months?", s)
-    if m:
-        day = _parse_ordinal_day(m.group(1))
-        n = int(m.group(2))
-        return _day_in_shifted_month(base, day, n, return_iso)
-
-    # ----------------------------
-    # E) "in N units" (days/weeks/months/years)
-    # ----------------------------
-    m = re.fullmatch(r"in\s+(\d+)\s+(day|days|week|weeks|month|months|year|years)", s)
-    if m:
-        n = int(m.group(1))
-        unit = m.group(2)
-        if unit.startswith("day"):
-            out = base + timedelta(days=n)
-        elif unit.startswith("week"):
-            out = base + timedelta(weeks=n)
-        elif unit.startswith("month"):
-            out = add_months(base, n)
-        else:
-            out = clamp_day(base.year + n, base.month, base.day)
-        return _maybe_iso(out, return_iso)
+    # Forms A-E all carry a number; name-only phrases ("next friday", "thanksgiving")
+    # go straight to the weekday/holiday lookups below.
+    if _DIGIT_PATTERN.search(s):
+        # ----------------------------
+        # A/B) Month + day, in any of the orders listed in `_MONTH_AND_DAY_BRANCHES`:
+        #     "next Dec. 3rd" / "next 3rd of december" / "the 3rd of december next" /
+        #     "3rd next december" / "the 3rd of december"
+        # ----------------------------
+        m = _MONTH_AND_DAY_PATTERN.fullmatch(s)
+        if m:
+            branch = m.lastgroup
+            # B4 has no modifier -> default behavior: upcoming/on-or-after base
+            modifier = _normalize_modifier(m.group(f"{branch}_mod") if branch != "b4" else None)
+            month = MONTHS[m.group(f"{branch}_month")]
+            day = _parse_ordinal_day(m.group(f"{branch}_day"))
+            return _resolve_month_day(month, day, base, modifier, return_iso)
+
+        # ----------------------------
+        # C) "<D> of the <mod> month" AND loose variants:
+        #     "26th of the next month" (already) + "on the 26th next month" / "26th next month"
+        # ----------------------------
+        m = _DAY_OF_MOD_MONTH_PATTERN.fullmatch(s)
+        if m:
+            day = _parse_ordinal_day(m.group(1))
+            mod = _normalize_modifier(m.group(2))
+            return _day_in_shifted_month(base, day, _shift_for_modifier(mod), return_iso)
+
+        # ----------------------------
+        # D) "<D> in N months"
+        # ----------------------------
+        m = _DAY_IN_N_MONTHS_PATTERN.fullmatch(s)
+        if m:
+            day = _parse_ordinal_day(m.group(1))
+            n = int(m.group(2))
+            return _day_in_shifted_month(base, day, n, return_iso)
+
+        # ----------------------------
+        # E) "in N units" (days/weeks/months/years)
+        # ----------------------------
+        m = _IN_N_UNITS_PATTERN.fullmatch(s)
+        if m:
+            n = int(m.group(1))
+            unit = m.group(2)
+            if unit.startswith("day"):
+                out = base + timedelta(days=n)
+            elif unit.startswith("week"):
+                out = base + timedelta(weeks=n)
+            elif unit.startswith("month"):
+                out = add_months(base, n)
+            else:
+                out = clamp_day(base.year + n, base.month, base.day)
+            return _maybe_iso(out, return_iso)
 
     # ----------------------------
     # F) Weekdays: "(this|next|upcoming|last) <weekday>"
     # ----------------------------
-    m = re.fullmatch(rf"(?:the\s+)?{_MOD_GROUP}?\s*([a-z]+)", s)
+    m = _WEEKDAY_PATTERN.fullmatch(s)
     if m and m.group(2) in WEEKDAYS:
         modifier = _normalize_modifier(m.group(1))
         target_wd = WEEKDAYS[m.group(2)]
         base_wd = base.weekday()
         if modifier in ("next", "coming", ""):  # treat bare weekday as upcoming (future strictly)
             delta = days_until_next_weekday(base_wd, target_wd)
-            out = base + timedelta(days=delta)
         elif modifier == "this":  # same-week, can be today
             delta = (target_wd - base_wd) % 7
-            out = base + timedelta(days=delta)
         else:  # last/previous
             # Same (target - current) % 7, bump-0-to-7 math as the "next" branch above,
             # just with the weekday arguments swapped since we're counting backwards.
-            delta = days_until_next_weekday(target_wd, base_wd)
-            out = base - timedelta(days=delta)
-        return _maybe_iso(out, return_iso)
+            delta = -days_until_next_weekday(target_wd, base_wd)
+        # plain int day arithmetic on the ordinal instead of building a timedelta
+        return _maybe_iso(date.fromordinal(base.toordinal() + delta), return_iso)
 
     # ----------------------------
     # G) Holidays: "(this|next|upcoming|last) <holiday>"
     # ----------------------------
-    hm = re.fullmatch(rf"(?:the\s+)?{_MOD_GROUP}?\s*(.+)", s)
+    hm = _HOLIDAY_PATTERN.fullmatch(s)
     if hm:
         modifier = _normalize_modifier(hm.group(1))
-        holiday_name = hm.group(2).strip()
-        candidates = [
-            holiday_name,
-            holiday_name.replace("’", "'"),
-            re.sub(r" day$", "", holiday_name),
-        ]
-        for cand in candidates:
-            key = _canon(cand)
-            if key in HOLIDAYS:
-                resolver = HOLIDAYS[key]  # function(year) -> date
-                y = base.year
-                d_this = resolver(y)
-                shift = _year_shift_for_modifier(d_this, base, modifier)
-                out = d_this if shift == 0 else resolver(y + shift)
-                return _maybe_iso(out, return_iso)
+        key = _HOLIDAY_KEYS.get(_canon(hm.group(2)))
+        if key is not None:
+            y = base.year
+            d_this = _resolve_holiday(key, y)
+            shift = _year_shift_for_modifier(d_this, base, modifier)
+            out = d_this if shift == 0 else _resolve_holiday(key, y + shift)
+            return _maybe_iso(out, return_iso)
     raise ValueError(f"Could not parse relative date description: '{text}'")
 
 
-def _iter_month_days(y: int, m: int):
-    for d in range(1, _days_in_month(y, m) + 1):
-        yield date(y, m, d)
+@lru_cache(maxsize=512)
+def _month_days_by_weekday(y: int, m: int) -> tuple[tuple[int, ...], ...]:
+    """Day numbers of month ``m`` in ``y`` grouped by weekday: entry ``wd`` (0=Mon) holds the
+    days that fall on that weekday, in ascending order."""
+    first_wd = date(y, m, 1).weekday()
+    last_day = _days_in_month(y, m)
+    return tuple(tuple(range(1 + (wd - first_wd) % 7, last_day + 1, 7)) for wd in range(7))
+
+
+def _weekday_dates_in_month(y: int, m: int, weekdays: set[int]) -> list[date]:
+    by_weekday = _month_days_by_weekday(y, m)
+    return [date(y, m, d) for wd in weekdays for d in by_weekday[wd]]
+
+
+# `_month_ref_to_year_month` patterns: "this/next/last month", then "[<mod>] <month>".
+_MOD_MONTH_PATTERN = re.compile(rf"{_MOD_GROUP}\s+month")
+_MOD_NAMED_MONTH_PATTERN = re.compile(rf"{_MOD_GROUP}?\s*([a-z.]+)")
 
 
 def _month_ref_to_year_month(text: str, base: date) -> tuple[int, int]:
@@ -429,7 +464,7 @@ def _month_ref_to_year_month(text: str, base: date) -> tuple[int, int]:
     """
     s = _canon(text)
     # this/next/last month
-    m = re.fullmatch(rf"{_MOD_GROUP}\s+month", s)
+    m = _MOD_MONTH_PATTERN.fullmatch(s)
     if m:
         mod = _normalize_modifier(m.group(1))
         dt = date(base.year, base.month, 15)
@@ -437,7 +472,7 @@ def _month_ref_to_year_month(text: str, base: date) -> tuple[int, int]:
         return dt2.year, dt2.month
 
     # explicit month (with optional modifier)
-    m = re.fullmatch(rf"{_MOD_GROUP}?\s*([a-z.]+)", s)
+    m = _MOD_NAMED_MONTH_PATTERN.fullmatch(s)
     if m and m.group(2) in MONTHS:
         mod = _normalize_modifier(m.group(1))
         mm = MONTHS[m.group(2)]
@@ -447,6 +482,12 @@ def _month_ref_to_year_month(text: str, base: date) -> tuple[int, int]:
     raise ValueError(f"Could not resolve month reference: '{text}'")
 
 
+# Separators between weekdays in a list like "Mondays, Wednesdays and Fridays".
+_WEEKDAY_LIST_SEPARATOR_PATTERN = re.compile(r"\s*(?:,|and|\&|\+)\s*")
+# Weekday name, abbreviation, or plural of either ("mondays", "sats") -> weekday index.
+_WEEKDAY_INDEX_BY_FORM = {form: WEEKDAYS[name] for form, name in WEEKDAY_SINGULAR.items()}
+
+
 def _collect_weekdays_list(chunk: str) -> set[int] | None:
     s = _canon(chunk)
     if "weekend" in s:
@@ -455,17 +496,17 @@ def _collect_weekdays_list(chunk: str) -> set[int] | None:
         return {WEEKDAYS[d] for d in ("monday", "tuesday", "wednesday", "thursday", "friday")}
 
     # try comma/and separated weekdays using the original chunk so commas are preserved
-    parts = re.split(r"\s*(?:,|and|\&|\+)\s*", chunk)
+    parts = _WEEKDAY_LIST_SEPARATOR_PATTERN.split(chunk)
+    # chunks cut from an already-canonical query (every caller in this module) split into
+    # already-canonical parts, so only re-canonicalize parts of raw input
+    already_canon = chunk == s
     out = set()
     for raw in parts:
-        p = _canon(raw).strip()
-        if not p:
-            continue
+        p = raw if already_canon else _canon(raw)
         # allow trailing 's' ("mondays")
-        p = p.rstrip(".")
-        p = WEEKDAY_SINGULAR.get(p, p)
-        if p in WEEKDAYS:
-            out.add(WEEKDAYS[p])
+        wd = _WEEKDAY_INDEX_BY_FORM.get(p.rstrip("."))
+        if wd is not None:
+            out.add(wd)
     return out or None
 
 
@@ -548,13 +589,38 @@ def _expand_md_range(
 def _expand_span(start: date, end: date, weekday_filter: set[int] | None = None) -> list[date]:
     if end < start:
         start, end = end, start
-    res = []
-    d = start
-    while d <= end:
-        if not weekday_filter or d.weekday() in weekday_filter:
-            res.append(d)
-        d += timedelta(days=1)
-    return res
+    first, last = start.toordinal(), end.toordinal()
+    if not weekday_filter:
+        return [date.fromordinal(o) for o in range(first, last + 1)]
+    # step through each wanted weekday's days directly (every 7th ordinal from its first
+    # occurrence) instead of testing every day in the span
+    start_wd = start.weekday()
+    ordinals = sorted(o for wd in weekday_filter for o in range(first + (wd - start_wd) % 7, last + 1, 7))
+    return [date.fromordinal(o) for o in ordinals]
+
+
+# `parse_relative_dates` patterns, tried in this order against the canonicalized query.
+# 0) "the <ordinal> week of (the)? <modifier> month" / "the <ordinal> week of <month-ref>"
+_ORDINAL_WEEK_OF_MOD_MONTH_PATTERN = re.compile(
+    rf"(?:the\s+)?(first|second|third|fourth|last|1st|2nd|3rd|4th)\s+week\s+of\s+(?:the\s+)?{_MOD_GROUP}\s+month"
+)
+_ORDINAL_WEEK_OF_MONTH_REF_PATTERN = re.compile(
+    r"(?:the\s+)?(first|second|third|fourth|last|1st|2nd|3rd|4th)\s+week\s+of\s+(?:the\s+)?(.+)"
+)
+# 1) "<weekdays> in (this|next|last) month"
+_WEEKDAYS_IN_MOD_MONTH_PATTERN = re.compile(rf"(.+?)\s+in\s+(?:the\s+)?{_MOD_GROUP}\s+month")
+# 2) "<weekdays> in <month-ref> through <month-ref>"
+_WEEKDAYS_IN_MONTHS_THROUGH_PATTERN = re.compile(r"(.+?)\s+in\s+(.+?)\s+through\s+(.+)")
+# 3) "[<weekdays>] from <date> through <date>"
+_FROM_THROUGH_PATTERN = re.compile(r"(.+?)\s+from\s+(.+?)\s+through\s+(.+)")
+# 4) " and "-separated month-day range chunks
+_AND_SEPARATOR_PATTERN = re.compile(r"\s+and\s+")
+
+
+# Token helper for the month-with-multiple-days walker (block 5) of `parse_relative_dates`.
+def _clean_tok(tok: str) -> str:
+    """Strip trailing punctuation from token."""
+    return tok.rstrip(",.;")
 
 
 def parse_relative_dates(query: str, base: date | None = None, return_iso: bool = True) -> list[date] | list[str]:
@@ -573,6 +639,11 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     if base is None:
         base = date.today()
     s = _canon(query)
+    # Each pattern branch below needs one of these literals (``s`` is canonical, so every
+    # ``\s+`` in the patterns is a single space); skip the regex when it is absent.
+    has_week_of = " week of " in s
+    has_in = " in " in s
+    has_through = " through " in s
 
     out: list[date] = []
 
@@ -582,10 +653,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     #    e.g., "the first week of the next month"
     #          "the second week of next Jan"
     # ------------------------------------------------------------
-    m = re.fullmatch(
-        rf"(?:the\s+)?(first|second|third|fourth|last|1st|2nd|3rd|4th)\s+week\s+of\s+(?:the\s+)?{_MOD_GROUP}\s+month",
-        s,
-    )
+    m = _ORDINAL_WEEK_OF_MOD_MONTH_PATTERN.fullmatch(s) if has_week_of else None
     if m:
         ordinal_str = m.group(1)
         mod = _normalize_modifier(m.group(2))
@@ -598,10 +666,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
         return _maybe_iso_list(out, return_iso)
 
     # Also check for "the <ordinal> week of <month-ref>"
-    m = re.fullmatch(
-        r"(?:the\s+)?(first|second|third|fourth|last|1st|2nd|3rd|4th)\s+week\s+of\s+(?:the\s+)?(.+)",
-        s,
-    )
+    m = _ORDINAL_WEEK_OF_MONTH_REF_PATTERN.fullmatch(s) if has_week_of else None
     if m:
         ordinal_str = m.group(1)
         month_ref = m.group(2)
@@ -622,13 +687,11 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     #    e.g., "Saturdays and Sundays in this month"
     #          "weekends in the next month"
     # ------------------------------------------------------------
-    m = re.fullmatch(rf"(.+?)\s+in\s+(?:the\s+)?{_MOD_GROUP}\s+month", s)
+    m = _WEEKDAYS_IN_MOD_MONTH_PATTERN.fullmatch(s) if has_in else None
     if m:
         wds = _parse_weekdays_or_raise(m.group(1))
         y, mo = _month_ref_to_year_month(m.group(2) + " month", base)
-        for d in _iter_month_days(y, mo):
-            if d.weekday() in wds:
-                out.append(d)
+        out = _weekday_dates_in_month(y, mo, wds)
         out.sort()
         return _maybe_iso_list(out, return_iso)
 
@@ -636,7 +699,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     # 2) "<weekdays> in <month-ref> through <month-ref>"
     #    "Mondays and Fridays in next Jan through May"
     # ------------------------------------------------------------
-    m = re.fullmatch(r"(.+?)\s+in\s+(.+?)\s+through\s+(.+)", s)
+    m = _WEEKDAYS_IN_MONTHS_THROUGH_PATTERN.fullmatch(s) if has_in and has_through else None
     if m:
         wds = _parse_weekdays_or_raise(m.group(1))
         y1, m1 = _month_ref_to_year_month(m.group(2), base)
@@ -644,9 +707,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
         # iterate months inclusive
         y, mo = y1, m1
         while (y < y2) or (y == y2 and mo <= m2):
-            for d in _iter_month_days(y, mo):
-                if d.weekday() in wds:
-                    out.append(d)
+            out.extend(_weekday_dates_in_month(y, mo, wds))
             # next month (day=1 never triggers clamp_day's end-of-month clamping)
             next_month = add_months(date(y, mo, 1), 1)
             y, mo = next_month.year, next_month.month
@@ -657,7 +718,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     # 3) "from <date> through <date>" with optional weekday filter in front
     #    "Sat and Sun from next Oct 12 through Nov 25"
     # ------------------------------------------------------------
-    m = re.fullmatch(r"(.+?)\s+from\s+(.+?)\s+through\s+(.+)", s)
+    m = _FROM_THROUGH_PATTERN.fullmatch(s) if has_through and " from " in s else None
     if m:
         # left side may be weekdays or the literal start date
         try:
@@ -688,7 +749,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     #    "next May 11-14 and May 18-21"
     # ------------------------------------------------------------
     # First, split by " and "
-    chunks = [c.strip() for c in re.split(r"\s+and\s+", s)]
+    chunks = [c.strip() for c in _AND_SEPARATOR_PATTERN.split(s)] if " and " in s else [s]
     if len(chunks) > 1:
         context_year, context_month = None, None
         context_modifier = ""
@@ -726,52 +787,40 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     # - Subsequent bare <day> tokens add to the same month until another month shows up.
     # - A new [mod]? <month> <day> switches context.
     # ------------------------------------------------------------
-    def _clean_tok(tok: str) -> str:
-        """Strip trailing punctuation from token."""
-        return tok.rstrip(",.;")
-
-    def _is_mod(tok: str) -> bool:
-        return tok in MODS
-
-    def _is_month(tok: str) -> bool:
-        # Strip trailing punctuation (commas, periods) before checking
-        return _clean_tok(tok) in MONTHS
-
-    def _day_from(tok: str) -> int | None:
-        # Strip trailing punctuation (commas, periods) before matching
-        return _parse_ordinal_day(_clean_tok(tok))
-
     tokens = s.split()
+    # Classify every token once up front: its punctuation-stripped form (commas, periods)
+    # for month lookups, and its day number (None unless e.g. "5"/"5th,").
+    cleaned = [_clean_tok(tok) for tok in tokens]
+    days = [_parse_ordinal_day(tok) for tok in cleaned]
+    n_tokens = len(tokens)
     i = 0
     cur_y = cur_m = None
     added_any = False
 
-    while i < len(tokens):
+    while i < n_tokens:
         tok = tokens[i]
 
         # Case A: [mod]? <month> <day>
-        if _is_mod(tok) and i + 2 < len(tokens) and _is_month(tokens[i + 1]) and _day_from(tokens[i + 2]) is not None:
-            mon_ref = f"{tok} {_clean_tok(tokens[i + 1])}"
+        if tok in MODS and i + 2 < n_tokens and cleaned[i + 1] in MONTHS and days[i + 2] is not None:
+            mon_ref = f"{tok} {cleaned[i + 1]}"
             cur_y, cur_m = _month_ref_to_year_month(mon_ref, base if cur_y is None else date(cur_y, cur_m, 15))
-            d = _day_from(tokens[i + 2])
-            out.append(date(cur_y, cur_m, d))
+            out.append(date(cur_y, cur_m, days[i + 2]))
             added_any = True
             i += 3
             continue
 
         # Case B: <month> <day>  (no modifier)
-        if _is_month(tok) and i + 1 < len(tokens) and _day_from(tokens[i + 1]) is not None:
-            mon_ref = _clean_tok(tokens[i])
+        if cleaned[i] in MONTHS and i + 1 < n_tokens and days[i + 1] is not None:
+            mon_ref = cleaned[i]
             # resolve relative to prior context mid-month if exists, else base
             cur_y, cur_m = _month_ref_to_year_month(mon_ref, base if cur_y is None else date(cur_y, cur_m, 15))
-            d = _day_from(tokens[i + 1])
-            out.append(date(cur_y, cur_m, d))
+            out.append(date(cur_y, cur_m, days[i + 1]))
             added_any = True
             i += 2
             continue
 
         # Case C: bare <day> (must have a month context already)
-        d = _day_from(tok)
+        d = days[i]
         if d is not None and cur_y is not None and cur_m is not None:
             out.append(date(cur_y, cur_m, d))
             added_any = True
@@ -791,7 +840,7 @@ def parse_relative_dates(query: str, base: date | None = None, return_iso: bool
     #    - Simple "in <month-ref>" with weekday phrase on the left already covered above
     #    - Otherwise, try single-date parser and return [that date]
     # ------------------------------------------------------------
-    m = _MONTH_DAY_RANGE_PATTERN.fullmatch(s)
+    m = _MONTH_DAY_RANGE_PATTERN.fullmatch(s) if "-" in s else None
     if m:
         modifier = _normalize_modifier(m.group(1))
         if m.group(2):
@@ -11,6 +11,7 @@ no direct test coverage of ``update``/``compute`` at all, only of the ``_normali
 helper they call internally.
 """
 
+import pytest
 from conftest import run_async as _run
 
 from navi_bench.apartments.apartments_url_match import ApartmentsUrlMatch
@@ -70,6 +71,28 @@ class TestNormalizeUrl:
         assert _normalize("https://www.apartments.com/") == "apartments.com"
 
 
+class TestNormalizeApartmentFeatures:
+    """Pin the longest-first, one-feature-at-a-time extraction of ``_normalize_apartment_features``:
+    each feature is stripped before the next (shorter) one is searched for."""
+
+    @pytest.mark.parametrize(
+        ("part", "expected"),
+        [
+            ("pet-friendly", "pet-friendly"),
+            ("pool-gated-parking", "gated-parking-pool"),
+            # "washer-dryer" is longer than "dishwasher", so it is extracted first
+            ("dishwasher-dryer", "dish-washer-dryer"),
+            # "washer_dryer-hookup" is extracted whole, leaving no "washer-dryer" behind
+            ("washer_dryer-hookup-dishwasher", "dishwasher-washer_dryer-hookup"),
+            # stripping "fitness-center" collapses the dashes into a "washer-dryer"
+            ("washerfitness-center-dryer", "fitness-center-washer-dryer"),
+            ("pool-pool", "pool"),
+        ],
+    )
+    def test_normalize_apartment_features(self, part, expected):
+        assert ApartmentsUrlMatch._normalize_apartment_features(part) == expected
+
+
 class TestInit:
     def test_single_string_gt_url_is_wrapped_in_a_list(self):
         metric = ApartmentsUrlMatch(gt_url="https://www.apartments.com/austin-tx")
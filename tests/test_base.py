@@ -14,8 +14,12 @@ from navi_bench.base import (
     DatasetItem,
     FinalResult,
     all_or_nothing_coverage_result,
+    basic_normalize_url,
     basic_pydantic_to_hf_features,
+    instantiate,
+    strip_url_scheme,
     unwrap_optional_type,
+    unwrap_single_template_query,
 )
 from navi_bench.google_flights.google_flights_search_match import GoogleFlightsSearchMatch
 from navi_bench.resy.resy_url_match import ResyUrlMatch
@@ -89,6 +93,62 @@ class TestGoogleFlightsSearchMatchComputeUsesSharedHelper:
         assert result.score == 1.0
 
 
+class TestStripUrlScheme:
+    """``strip_url_scheme`` removes whole prefixes, not sets of characters as ``str.lstrip``
+    would (which turns e.g. "httptest.com" into "est.com")."""
+
+    def test_strips_scheme_and_www(self):
+        assert strip_url_scheme("https://www.apartments.com/austin-tx") == "apartments.com/austin-tx"
+        assert strip_url_scheme("http://www.apartments.com") == "apartments.com"
+
+    def test_host_sharing_characters_with_prefixes_is_untouched(self):
+        assert strip_url_scheme("httptest.com") == "httptest.com"
+        assert strip_url_scheme("https://wwwidget.com") == "wwwidget.com"
+
+
+class TestBasicNormalizeUrl:
+    """``basic_normalize_url`` normalizes through ``strip_url_scheme`` + ``urlparse``; pin what
+    that pair does beyond lowercasing."""
+
+    def test_last_segment_params_are_dropped(self):
+        parsed, _ = basic_normalize_url("https://www.apartments.com/a;b?io=1", "apartments.com")
+        assert (parsed.netloc, parsed.path, parsed.query) == ("apartments.com", "/a", "io=1")
+
+    def test_chained_scheme_prefixes_are_all_stripped(self):
+        assert basic_normalize_url("https://http://www.example.com/x/", "apartments.com") == (None, "example.com/x")
+
+
+class TestUnwrapSingleTemplateQuery:
+    def test_returns_the_single_item(self):
+        assert unwrap_single_template_query([["url"]], group_message="group", item_message="item") == "url"
+
+    @pytest.mark.parametrize(
+        ("template_query", "message"), [([], "group"), ([["a"], ["b"]], "group"), ([["a", "b"]], "item")]
+    )
+    def test_rejects_anything_but_one_group_of_one_item(self, template_query, message):
+        with pytest.raises(ValueError, match=message):
+            unwrap_single_template_query(template_query, group_message="group", item_message="item")
+
+
+class TestInstantiate:
+    def test_nested_targets_and_containers_are_instantiated(self):
+        config = {
+            "_target_": "navi_bench.base.FinalResult",
+            "score": 1.0,
+            "reasoning": {"_target_": "builtins.str", "_args_": [[1, {"a": (2, 3)}]]},
+        }
+
+        assert instantiate(config) == FinalResult(score=1.0, reasoning="[1, {'a': [2, 3]}]")
+
+    def test_non_recursive_node_is_returned_as_is(self):
+        inner = {"_target_": "builtins.str", "_recursive_": False}
+
+        assert instantiate({"x": inner, "y": [inner]}) == {"x": inner, "y": [inner]}
+
+    def test_leaf_is_returned_as_is(self):
+        assert instantiate("text") == "text"
+
+
 class TestUnwrapOptionalType:
     """Characterization tests for the shared ``Optional[T]``/``T | None`` unwrapping logic,
     extracted from the near-identical duplicate in ``basic_pydantic_to_hf_features`` and
@@ -39,6 +39,8 @@ import pytest
 import navi_bench.dates as dates_module
 from navi_bench.base import UserMetadata
 from navi_bench.dates import (
+    format_month_day,
+    format_natural_date,
     initialize_placeholder_map,
     initialize_user_metadata,
     render_task_statement,
@@ -232,6 +234,13 @@ class TestResolvePlaceholderValuesDynamicOffset:
         assert iso_dates == ["2026-12-03"]
         assert is_dynamic is False
 
+    def test_string_parsing_is_memoized_but_returns_fresh_lists(self):
+        first = resolve_placeholder_values("weekends in the next month", self.BASE)[1]
+        hits = dates_module._parse_relative_iso_dates.cache_info().hits
+        second = resolve_placeholder_values("weekends in the next month", self.BASE)[1]
+        assert dates_module._parse_relative_iso_dates.cache_info().hits == hits + 1
+        assert second == first and second is not first
+
 
 class _FrozenDatetime(datetime):
     """``datetime`` subclass whose ``now()`` always returns a fixed instant.
@@ -315,3 +324,12 @@ class TestRenderTaskStatement:
 
     def test_statement_without_placeholders_is_returned_unchanged(self):
         assert render_task_statement("no placeholders here", {}) == "no placeholders here"
+
+
+class TestFormatNaturalDate:
+    """Pin the table-driven month formatting against the ``strftime`` output it replaced."""
+
+    @pytest.mark.parametrize("d", [date(2025, 1, 5), date(2025, 9, 30), date(2024, 2, 29), date(2025, 12, 1)])
+    def test_matches_strftime(self, d):
+        assert format_month_day(d) == d.strftime("%B %d")
+        assert format_natural_date(d) == d.strftime("%B %d, %Y")
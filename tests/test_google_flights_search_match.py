@@ -63,6 +63,17 @@ class TestCreateBaseInfo:
 
         assert not info.data[0].HasField("max_stops")
 
+    def test_non_iso_segment_date_raises_value_error(self):
+        gt_info = {
+            "segments": [{"from": "SFO", "to": "MSP", "date": "dateRange.0"}],
+            "passengers": ["ADULT"],
+            "seat": "ECONOMY",
+            "trip": "ONE_WAY",
+        }
+
+        with pytest.raises(ValueError, match="YYYY-MM-DD"):
+            GoogleFlightsSearchMatch._create_base_info(gt_info)
+
     def test_multi_segment_and_multi_passenger_round_trip(self):
         gt_info = {
             "segments": [
@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 
 import pytest
 from conftest import run_async as _run
+from loguru import logger
 
 from navi_bench.opentable.opentable_info_gathering import (
     DATE_OPTIONS,
@@ -21,10 +22,17 @@ from navi_bench.opentable.opentable_info_gathering import (
     MultiCandidateQuery,
     OpenTableInfoGathering,
     SingleCandidateQuery,
+    _date_time_to_timestamp,
+    _days_until_date_on,
     _format_weekend_span,
+    _parse_date_time_range,
+    _render_placeholders_in_queries_all,
+    _render_placeholders_in_queries_any,
     get_days_until_date,
     get_first_weekend_of_next_month_offsets,
     get_next_weekend_offsets,
+    normalize_time_string,
+    time_to_natural_language,
 )
 
 
@@ -99,6 +107,15 @@ class TestCheckMultiCandidateQuery:
         assert result is True
         assert evidences == []
 
+    def test_none_only_restaurant_names_is_no_name_constraint(self):
+        # ``_render_placeholders_in_queries_all`` renders ``[None]`` for a template without names.
+        query: MultiCandidateQuery = {"restaurant_names": [None], "dates": ["2025-07-10"], "times": ["19:00:00"]}
+        gathering = OpenTableInfoGathering(queries=[[query]])
+
+        _run(gathering.update(page=_FakePage([_info(info="Table for 2 is available.")])))
+
+        assert gathering._is_query_covered == [True]
+
     def test_available_branch_date_mismatch_returns_false_no_evidence(self):
         query: MultiCandidateQuery = {"dates": ["2025-07-11"], "times": ["19:00:00"]}
         info = _info(info="Table for 2 is available.")
@@ -283,9 +300,9 @@ class TestIsExhausted:
 
 
 class TestSkipsAlreadyCoveredQueries:
-    """Pin the "skip queries already marked covered" guard shared by ``update``, ``compute``,
-    and ``_mark_uncovered_queries_with_unconditional_evidence`` via the single
-    ``_iter_uncovered_queries`` generator all three delegate to.
+    """Pin the "skip queries already marked covered" guard shared by ``update``, ``compute``
+    (via the ``_iter_uncovered_queries`` generator both delegate to), and
+    ``_mark_uncovered_queries_with_unconditional_evidence`` (via its restaurant index).
     """
 
     def test_update_does_not_reprocess_an_already_covered_query(self):
@@ -305,6 +322,18 @@ class TestSkipsAlreadyCoveredQueries:
         assert gathering._unavailable_evidences[1][0] == [info]
         assert gathering._is_query_covered == [True, False]
 
+    def test_update_skips_page_evaluation_once_every_query_is_covered(self):
+        class _FailingPage:
+            async def evaluate(self, _js_script: str) -> list[InfoDict]:
+                raise AssertionError("page should not be evaluated once every query is covered")
+
+        gathering = OpenTableInfoGathering(queries=[[{"dates": ["2025-07-10"]}]])
+        gathering._is_query_covered[0] = True
+
+        _run(gathering.update(page=_FailingPage()))
+
+        assert gathering._all_infos == []
+
     def test_compute_leaves_already_covered_query_untouched_and_marks_exhausted_query_covered(self):
         queries: list[list[MultiCandidateQuery]] = [
             [{"dates": ["2025-07-10"], "times": ["19:00:00"]}],
@@ -336,6 +365,22 @@ class TestSkipsAlreadyCoveredQueries:
         # Query 1's only date (06-01) is < 07-01: left uncovered.
         assert gathering._is_query_covered == [True, False]
 
+    def test_handle_too_far_in_advance_only_considers_conditions_naming_the_restaurant(self):
+        queries: list[list[MultiCandidateQuery]] = [
+            [{"restaurant_names": ["Abrazo"], "dates": ["2025-07-10"]}],
+            [
+                {"restaurant_names": ["chez tj"], "dates": ["2025-06-01"]},
+                {"restaurant_names": ["Chez-TJ", "CHEZ TJ"], "dates": ["2025-07-10"]},
+            ],
+            [{"dates": ["2025-07-10"]}],
+        ]
+        gathering = OpenTableInfoGathering(queries=queries)
+
+        gathering._handle_too_far_in_advance(_info(restaurantName="Chez TJ", date="2025-07-01"))
+
+        # Only query 1 names Chez TJ (case-insensitively); its second condition is all >= 07-01.
+        assert gathering._is_query_covered == [False, True, False]
+
     def test_handle_party_too_small_marks_matching_uncovered_query(self):
         queries: list[list[MultiCandidateQuery]] = [
             [{"restaurant_names": ["chez tj"], "party_sizes": [6]}],
@@ -349,6 +394,19 @@ class TestSkipsAlreadyCoveredQueries:
         # Query 1's party size (2) is <= 4: covered.
         assert gathering._is_query_covered == [False, True]
 
+    def test_handle_party_too_small_ignores_none_party_sizes(self):
+        queries: list[list[MultiCandidateQuery]] = [
+            [{"restaurant_names": ["chez tj"], "party_sizes": [None, 2]}],
+            [{"restaurant_names": ["chez tj"], "party_sizes": [None]}],
+        ]
+        gathering = OpenTableInfoGathering(queries=queries)
+
+        gathering._handle_party_too_small_or_too_large(_info(restaurantName="Chez TJ", partySize=4), issue="too small")
+
+        # Query 0's only concrete party size (2) is <= 4: covered.
+        # Query 1 has no concrete party size to rule out: left uncovered.
+        assert gathering._is_query_covered == [True, False]
+
 
 @pytest.mark.parametrize(
     ("info_kwargs", "query_dates", "query_times", "expect_matched"),
@@ -415,6 +473,77 @@ def test_multi_and_single_candidate_agree_on_match_outcome(info_kwargs, query_da
         assert evidences == ([info] if expect_matched else [])
 
 
+def test_js_script_is_shared_across_instances():
+    first = OpenTableInfoGathering(queries=[]).js_script
+    second = OpenTableInfoGathering(queries=[]).js_script
+
+    assert first is second
+    assert "isVisible" in first
+
+
+class TestConvertDateTimeToTimestamp:
+    """Pin the timestamp converter (hand-sliced for zero-padded input, ``strptime`` otherwise)
+    against the plain ``strptime`` parse it replaced."""
+
+    @pytest.mark.parametrize(
+        ("date", "time"),
+        [
+            ("2025-07-10", "19:00:00"),
+            ("2024-02-29", "00:00:00"),
+            ("2025-12-31", "23:59:59"),
+            ("2025-07-10", "9:00:00"),  # unpadded hour, from a "9:00" meal time
+        ],
+    )
+    def test_matches_strptime(self, date, time):
+        expected = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M:%S").timestamp()
+        assert _date_time_to_timestamp(date, time) == expected
+
+    def test_rejects_time_without_seconds(self):
+        with pytest.raises(ValueError):
+            _date_time_to_timestamp("2025-07-10", "19:00")
+
+
+class TestParseDateTimeRange:
+    def test_within_hours_window(self):
+        base_ts = _date_time_to_timestamp("2025-07-10", "19:00:00")
+        assert _parse_date_time_range("2025-07-10", "19:00:00", _NO_ONLINE_AVAILABILITY_INFO) == (
+            base_ts - 2 * 3600,
+            base_ts + 2 * 3600,
+        )
+
+    def test_unparseable_info_warns_on_every_call(self):
+        # The window parse is memoized; the warning must not be swallowed by that cache.
+        messages: list[str] = []
+        handler_id = logger.add(messages.append, level="WARNING")
+        try:
+            for _ in range(2):
+                base_ts = _date_time_to_timestamp("2025-07-10", "19:00:00")
+                assert _parse_date_time_range("2025-07-10", "19:00:00", "No online availability") == (base_ts, base_ts)
+        finally:
+            logger.remove(handler_id)
+        assert len(messages) == 2
+
+
+class TestTimeStringHelpers:
+    """Pin ``time_to_natural_language``/``normalize_time_string`` on the HH:MM and HH:MM:SS
+    (and unpadded-hour) inputs ``generate_task_config_random`` accepts as meal times.
+    """
+
+    @pytest.mark.parametrize(
+        ("time_str", "expected"),
+        [("18:00", "6pm"), ("18:30:00", "6:30pm"), ("9:05", "9:05am"), ("00:00:00", "12am"), ("12:15", "12:15pm")],
+    )
+    def test_time_to_natural_language(self, time_str, expected):
+        assert time_to_natural_language(time_str) == expected
+
+    @pytest.mark.parametrize(
+        ("time_str", "expected"),
+        [("18:00", "18:00:00"), ("18:30:00", "18:30:00"), ("9:05", "9:05:00")],
+    )
+    def test_normalize_time_string(self, time_str, expected):
+        assert normalize_time_string(time_str) == expected
+
+
 class TestMealTimes:
     """Pin the exact quarter-hour time slots for each meal, extracted verbatim from the
     hand-written literal lists ``MEAL_TIMES`` used to hold before they were replaced by a
@@ -532,6 +661,18 @@ class TestGetDaysUntilDateFollowingAndTwoWeekends:
         assert get_days_until_date("the next two weekends", today) == [7, 8, 14, 15]
 
 
+class TestDaysUntilDateOn:
+    """``_days_until_date_on`` is ``generate_task_config_random``'s memoized, date-keyed entry
+    point to ``get_days_until_date``; any time of day on the same date must give the same
+    offsets as the uncached function."""
+
+    @pytest.mark.parametrize("date_label", DATE_OPTIONS)
+    def test_matches_get_days_until_date(self, date_label):
+        today = datetime(2025, 11, 30, 23, 45, tzinfo=timezone.utc)
+        expected = get_days_until_date(date_label, today)
+        assert list(_days_until_date_on(date_label, today.toordinal(), today.tzinfo)) == expected
+
+
 class TestGetNextWeekendOffsets:
     """Pin the exact offsets returned by ``get_next_weekend_offsets``, which delegates its
     Saturday-rollover math to the shared ``relative_dates.days_until_next_weekday`` helper
@@ -654,3 +795,46 @@ class TestNextTwoWeekendsDateNatural:
             datetime(2021, 1, 3, tzinfo=timezone.utc),
         ]
         assert _next_two_weekends_date_natural(target_dates) == "December 26-27, 2020 and January 02-3, 2021"
+
+
+class TestRenderPlaceholdersInQueriesAll:
+    def test_expands_one_singleton_query_per_date_name_time_and_party_size_in_order(self):
+        template: list[list[MultiCandidateQuery]] = [
+            [{"restaurant_names": ["abrazo"], "times": ["18:00:00", "19:00:00"], "party_sizes": [2]}]
+        ]
+        resolved = {"PLACEHOLDER_0": ("Saturdays", ["2025-07-12", "2025-07-19"])}
+
+        queries = _render_placeholders_in_queries_all(template, resolved)
+
+        assert [(q[0]["dates"][0], q[0]["times"][0]) for q in queries] == [
+            ("2025-07-12", "18:00:00"),
+            ("2025-07-12", "19:00:00"),
+            ("2025-07-19", "18:00:00"),
+            ("2025-07-19", "19:00:00"),
+        ]
+        assert queries[0] == [
+            {"restaurant_names": ["abrazo"], "dates": ["2025-07-12"], "times": ["18:00:00"], "party_sizes": [2]}
+        ]
+
+
+class TestRenderPlaceholdersInQueriesAny:
+    def test_replaces_each_placeholder_template_with_its_dates_in_place(self):
+        queries: list[list[MultiCandidateQuery]] = [
+            [{"dates": "{PLACEHOLDER_0}"}, {"dates": "{PLACEHOLDER_1}"}],
+            [{"dates": ["2025-07-01"]}, {"times": ["19:00:00"]}],
+        ]
+        resolved = {
+            "PLACEHOLDER_0": ("next Saturday", ["2025-07-12"]),
+            "PLACEHOLDER_1": ("next weekend", ["2025-07-12", "2025-07-13"]),
+        }
+
+        rendered = _render_placeholders_in_queries_any(queries, resolved)
+
+        assert rendered == [
+            [{"dates": ["2025-07-12"]}, {"dates": ["2025-07-12", "2025-07-13"]}],
+            [{"dates": ["2025-07-01"]}, {"times": ["19:00:00"]}],
+        ]
+
+    def test_rejects_a_placeholder_with_no_resolved_dates(self):
+        with pytest.raises(ValueError, match="PLACEHOLDER_0"):
+            _render_placeholders_in_queries_any([[{"dates": "{PLACEHOLDER_1}"}]], {"PLACEHOLDER_0": ("past", [])})
@@ -10,12 +10,16 @@ characterization tests before/alongside structural refactors of untested code) a
 behavior across the ``_MONTH_DAY_RANGE_PATTERN`` regex-dedup refactor in this file.
 """
 
+import calendar
 from datetime import date
 
 import pytest
 
 from navi_bench.relative_dates import (
+    HOLIDAYS,
     _expand_md_range,
+    _month_days_by_weekday,
+    _resolve_holiday,
     days_until_next_weekday,
     parse_relative_date,
     parse_relative_dates,
@@ -460,3 +464,33 @@ class TestExpandMdRangeDirect:
         assert _expand_md_range(2025, 5, 11, 14, base=base, modifier="coming") == _expand_md_range(
             2025, 5, 11, 14, base=base, modifier="next"
         )
+
+
+class TestResolveHoliday:
+    """``_resolve_holiday`` memoizes the ``HOLIDAYS`` resolvers per (key, year) for the
+    holiday branch of ``parse_relative_date``; it must agree with calling them directly."""
+
+    @pytest.mark.parametrize("year", [2024, 2025, 2026])
+    def test_matches_resolvers(self, year):
+        for key, resolver in HOLIDAYS.items():
+            assert _resolve_holiday(key, year) == resolver(year)
+
+    def test_repeated_parse_hits_cache(self):
+        parse_relative_date("next easter", base=BASE_DATE)
+        hits = _resolve_holiday.cache_info().hits
+        assert parse_relative_date("next easter", base=BASE_DATE) == "2026-04-05"
+        assert _resolve_holiday.cache_info().hits > hits
+
+
+class TestMonthDaysByWeekday:
+    """``_month_days_by_weekday`` backs the "<weekdays> in <month>" branches of
+    ``parse_relative_dates``; each entry must list exactly the days on that weekday."""
+
+    @pytest.mark.parametrize("year,month", [(2025, 11), (2024, 2), (2025, 2), (2026, 8)])
+    def test_matches_date_weekday(self, year, month):
+        by_weekday = _month_days_by_weekday(year, month)
+        for wd in range(7):
+            expected = tuple(
+                d for d in range(1, calendar.monthrange(year, month)[1] + 1) if date(year, month, d).weekday() == wd
+            )
+            assert by_weekday[wd] == expected